@@ -1,74 +1,92 @@
+import numpy as np
 import pandas as pd
-import pymysql
 from datetime import datetime
 from datetime import timedelta
-from Investar import Analyzer
+from Investar import Analyzer, Momentum
 
 class DualMomentum:
-    def __init__(self):
-        """생성자: KRX 종목코드(codes)를 구하기 위한 MarkgetDB 객체 생성"""
+    def __init__(self, price_store=None):
+        """생성자: KRX 종목코드(codes)를 구하기 위한 MarkgetDB 객체 생성
+            - price_store : DBUpdater 가 만든 memmap 저장소 폴더 ('price_store')
+                            지정하면 DB 대신 저장소에서 종가를 읽음
+        """
         self.mk = Analyzer.MarketDB()
+        self.price_store = price_store
     
-    def get_rltv_momentum(self, start_date, end_date, stock_count):
+    def load_closes(self, codes, start_date, end_date):
+        """codes 종목들의 start_date, end_date 종가를 종목 순서대로 읽음
+        (memmap 저장소가 있으면 두 날짜 열만, 없으면 단면 조회 한 번)
+            - codes : 종목코드 리스트
+            리턴값: (종목코드 배열, 시작일 종가 배열, 종료일 종가 배열), 시세 없으면 NaN
+        """
+        codes = np.array(codes, dtype=object)
+        if self.price_store is not None:
+            closes = self.mk.get_price_store(self.price_store).at('close',
+                [start_date, end_date], codes)
+        else:
+            close = self.mk.get_cross_section([start_date, end_date])['close']
+            close = close.unstack(level='date').reindex(index=codes,
+                columns=pd.to_datetime([start_date, end_date]))
+            closes = close.values.astype(np.float64)
+        return codes, closes[:, 0], closes[:, 1]
+
+    def get_returns(self, codes, start_date, end_date, stock_count=None):
+        """codes 종목들의 start_date 종가 대비 end_date 종가 수익률 (수익률순)
+        (두 날짜의 종가를 한 번에 읽고 NumPy 로 수익률 계산과 순위 선택)
+            - codes       : 종목코드 리스트 (두 날짜 중 시세가 없는 종목은 제외)
+            - start_date  : DB에 있는 시작 거래일 ('2020-01-02')
+            - end_date    : DB에 있는 종료 거래일 ('2020-12-30')
+            - stock_count : 상위 종목수 (None 이면 전체)
+        """
+        columns = ['code', 'company', 'old_price', 'new_price', 'returns']
+        codes, old_price, new_price = self.load_closes(codes, start_date,
+            end_date)
+        returns = Momentum.period_returns(old_price, new_price)
+        picked = Momentum.top_n(returns, stock_count)
+        df = pd.DataFrame({'code': codes[picked],
+            'company': [self.mk.codes.get(code) for code in codes[picked]],
+            'old_price': old_price[picked].astype('int64'),
+            'new_price': new_price[picked].astype('int64'),
+            'returns': returns[picked]}, columns=columns)
+        return df
+
+    def get_rltv_momentum(self, start_date, end_date, stock_count,
+            universe=None):
         """특정 기간 동안 수익률이 제일 높았던 stock_count 개의 종목들 (상대 모멘텀)
             - start_date  : 상대 모멘텀을 구할 시작일자 ('2020-01-01')   
             - end_date    : 상대 모멘텀을 구할 종료일자 ('2020-12-31')
             - stock_count : 상대 모멘텀을 구할 종목수
+            - universe    : Universe.UniverseFilter (지정하면 종료일 기준으로
+                            조건을 만족하는 종목만 순위를 매김)
         """       
-        connection = pymysql.connect(host='localhost', port=3306, 
-            db='INVESTAR', user='root', passwd='doolman', autocommit=True)
-        cursor = connection.cursor()
-        
-        # 사용자가 입력한 시작일자를 DB에서 조회되는 일자로 보정 
-        sql = f"select max(date) from daily_price where date <= '{start_date}'"
-        cursor.execute(sql)
-        result = cursor.fetchone()
-        if (result[0] is None):
-            print ("start_date : {} -> returned None".format(sql))
+        calendar = self.mk.calendar
+
+        # 사용자가 입력한 시작일자를 DB에서 조회되는 일자로 보정 (거래일 달력)
+        start_day = calendar.prev_day(start_date)
+        if start_day is None:
+            print (f"start_date : {start_date} -> returned None")
             return
-        start_date = result[0].strftime('%Y-%m-%d')
+        start_date = start_day
 
 
         # 사용자가 입력한 종료일자를 DB에서 조회되는 일자로 보정
-        sql = f"select max(date) from daily_price where date <= '{end_date}'"
-        cursor.execute(sql)
-        result = cursor.fetchone()
-        if (result[0] is None):
-            print ("end_date : {} -> returned None".format(sql))
+        end_day = calendar.prev_day(end_date)
+        if end_day is None:
+            print (f"end_date : {end_date} -> returned None")
             return
-        end_date = result[0].strftime('%Y-%m-%d')
+        end_date = end_day
 
 
-        # KRX 종목별 수익률을 구해서 2차원 리스트 형태로 추가
-        rows = []
-        columns = ['code', 'company', 'old_price', 'new_price', 'returns']
-        for _, code in enumerate(self.mk.codes):            
-            sql = f"select close from daily_price "\
-                f"where code='{code}' and date='{start_date}'"
-            cursor.execute(sql)
-            result = cursor.fetchone()
-            if (result is None):
-                continue
-            old_price = int(result[0])
-            sql = f"select close from daily_price "\
-                f"where code='{code}' and date='{end_date}'"
-            cursor.execute(sql)
-            result = cursor.fetchone()
-            if (result is None):
-                continue
-            new_price = int(result[0])
-            returns = (new_price / old_price - 1) * 100
-            rows.append([code, self.mk.codes[code], old_price, new_price, 
-                returns])
-
-
-        # 상대 모멘텀 데이터프레임을 생성한 후 수익률순으로 출력
-        df = pd.DataFrame(rows, columns=columns)
-        df = df[['code', 'company', 'old_price', 'new_price', 'returns']]
-        df = df.sort_values(by='returns', ascending=False)
-        df = df.head(stock_count)
-        df.index = pd.Index(range(stock_count))
-        connection.close()
+        # 거래 가능한 종목만 남긴 뒤 (universe 조건은 SQL 에서 평가)
+        if universe is None:
+            codes = list(self.mk.codes)
+        else:
+            codes = self.mk.get_universe(end_date, universe, self.price_store)
+            print(f"{universe} : {len(codes)} codes")
+
+        # 수익률을 한 번에 구하고 상위 stock_count 개만 선택
+        df = self.get_returns(codes, start_date, end_date, stock_count)
+        df.index = pd.Index(range(len(df)))
         print(df)
         print(f"\nRelative momentum ({start_date} ~ {end_date}) : "\
             f"{df['returns'].mean():.2f}% \n")
@@ -81,62 +99,71 @@ class DualMomentum:
             - end_date      : 절대 모멘텀을 구할 매도일 ('2020-12-31')
         """
         stockList = list(rltv_momentum['code'])        
-        connection = pymysql.connect(host='localhost', port=3306, 
-            db='INVESTAR', user='root', passwd='doolman', autocommit=True)
-        cursor = connection.cursor()
-
-
-        # 사용자가 입력한 매수일을 DB에서 조회되는 일자로 변경 
-        sql = f"select max(date) from daily_price "\
-            f"where date <= '{start_date}'"
-        cursor.execute(sql)
-        result = cursor.fetchone()
-        if (result[0] is None):
-            print ("{} -> returned None".format(sql))
+        calendar = self.mk.calendar
+
+
+        # 사용자가 입력한 매수일을 DB에서 조회되는 일자로 변경 (거래일 달력)
+        start_day = calendar.prev_day(start_date)
+        if start_day is None:
+            print (f"{start_date} -> returned None")
             return
-        start_date = result[0].strftime('%Y-%m-%d')
+        start_date = start_day
 
 
         # 사용자가 입력한 매도일을 DB에서 조회되는 일자로 변경 
-        sql = f"select max(date) from daily_price "\
-            f"where date <= '{end_date}'"
-        cursor.execute(sql)
-        result = cursor.fetchone()
-        if (result[0] is None):
-            print ("{} -> returned None".format(sql))
+        end_day = calendar.prev_day(end_date)
+        if end_day is None:
+            print (f"{end_date} -> returned None")
             return
-        end_date = result[0].strftime('%Y-%m-%d')
+        end_date = end_day
 
 
-        # 상대 모멘텀의 종목별 수익률을 구해서 2차원 리스트 형태로 추가
-        rows = []
-        columns = ['code', 'company', 'old_price', 'new_price', 'returns']
-        for _, code in enumerate(stockList):            
-            sql = f"select close from daily_price "\
-                f"where code='{code}' and date='{start_date}'"
-            cursor.execute(sql)
-            result = cursor.fetchone()
-            if (result is None):
-                continue
-            old_price = int(result[0])
-            sql = f"select close from daily_price "\
-                f"where code='{code}' and date='{end_date}'"
-            cursor.execute(sql)
-            result = cursor.fetchone()
-            if (result is None):
-                continue
-            new_price = int(result[0])
-            returns = (new_price / old_price - 1) * 100
-            rows.append([code, self.mk.codes[code], old_price, new_price,
-                returns])
-
-
-        # 절대 모멘텀 데이터프레임을 생성한 후 수익률순으로 출력
-        df = pd.DataFrame(rows, columns=columns)
-        df = df[['code', 'company', 'old_price', 'new_price', 'returns']]
-        df = df.sort_values(by='returns', ascending=False)
-        connection.close()
+        # 상대 모멘텀 종목들의 수익률을 한 번에 구해서 수익률순으로 출력
+        df = self.get_returns(stockList, start_date, end_date)
         print(df)
         print(f"\nAbasolute momentum ({start_date} ~ {end_date}) : "\
             f"{df['returns'].mean():.2f}%")
         return
+
+    def backtest(self, start_date, end_date, lookback=120, hold=20,
+            stock_count=20, min_return=0.0, cost=0.0):
+        """start_date ~ end_date 동안 hold 거래일마다 듀얼 모멘텀으로
+        리밸런싱했을 때의 평가액 곡선 (전 기간 누적 수익 지수를 한 번 읽어서 계산)
+            - lookback    : 상대 모멘텀을 구하는 과거 거래일 수 (120 이면 약 6개월)
+            - hold        : 보유 거래일 수 (20 이면 약 월간 리밸런싱)
+            - stock_count : 상대 모멘텀 상위 종목수
+            - min_return  : 절대 모멘텀 기준 수익률 (이하이면 그 자리는 현금)
+            - cost        : 회전율 1 당 거래비용 비율 (0.003 이면 0.3%)
+            리턴값: (일별 평가액 Series, 리밸런싱 기간별 데이터프레임)
+        """
+        # 첫 리밸런싱일의 lookback 거래일 전부터 종료일까지 한 번에 읽음
+        loaded = Momentum.load_index(self.mk, start_date, end_date, lookback)
+        if loaded is None:
+            print(f"{start_date} ~ {end_date} -> returned None")
+            return
+        days, codes, index, first = loaded
+        result = Momentum.backtest(index, lookback, hold, stock_count, first,
+            min_return, cost)
+
+        codes = np.array(codes, dtype=object)
+        equity = pd.Series(result['equity'], index=days[result['days']],
+            name='equity')
+        rebalance = result['rebalance']
+        periods = pd.DataFrame({
+            'end_date': days[np.minimum(rebalance + hold, len(days) - 1)],
+            'holdings': [list(codes[row[row >= 0]])
+                for row in result['holdings']],
+            'momentum': np.nanmean(result['momentum'], axis=1) * 100,
+            'returns': result['returns'] * 100,
+            'turnover': result['turnover']}, index=days[rebalance])
+
+        years = (equity.index[-1] - equity.index[0]).days / 365.25
+        cagr = equity.iloc[-1] ** (1 / years) - 1 if years > 0 else 0.0
+        mdd = (equity / equity.cummax() - 1).min()
+        print(periods[['end_date', 'momentum', 'returns', 'turnover']])
+        print(f"\nDual momentum backtest ({equity.index[0].date()} ~ "\
+            f"{equity.index[-1].date()}, lookback {lookback}, hold {hold}, "\
+            f"{stock_count} stocks) : total {(equity.iloc[-1] - 1) * 100:.2f}%"\
+            f", CAGR {cagr * 100:.2f}%, MDD {mdd * 100:.2f}%, "\
+            f"turnover {periods['turnover'].mean():.2f}")
+        return equity, periods
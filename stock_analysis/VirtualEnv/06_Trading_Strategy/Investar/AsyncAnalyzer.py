@@ -0,0 +1,213 @@
+import sys
+import time
+import asyncio
+import pymysql
+import pandas as pd
+from datetime import datetime
+
+try:
+    import aiomysql
+except ImportError:
+    aiomysql = None  # pip install aiomysql
+
+try:
+    from Investar import Analyzer, PriceCache, CodeIndex, DBPool, FastQuery
+except ImportError:
+    import Analyzer, PriceCache, CodeIndex, DBPool, FastQuery
+
+class AsyncMarketDB:
+    def __init__(self, minsize=1, maxsize=10, cache_rows=2000000,
+            version_check_secs=10, chunk_rows=10000):
+        """생성자: asyncio 용 MarketDB (연결 풀은 connect() 또는 첫 조회에서 생성)
+            - minsize, maxsize   : aiomysql 커넥션 풀의 최소/최대 연결 수
+            - cache_rows         : 시세 캐시가 보관할 최대 행 수 (0 이면 캐시 안 함)
+            - version_check_secs : DB 데이터 버전을 다시 확인하는 최소 간격(초)
+            - chunk_rows         : 커서에서 한 번에 꺼내는 행 수
+            조회 결과와 오류 메시지는 Analyzer.MarketDB 와 같다.
+        """
+        if aiomysql is None:
+            raise ImportError("AsyncMarketDB requires aiomysql "\
+                "(pip install aiomysql)")
+        self.minsize = minsize
+        self.maxsize = maxsize
+        self.chunk_rows = chunk_rows
+        self.pool = None
+        self.lock = None  # 실행 중인 이벤트 루프에서 만들어야 하므로 connect() 에서 생성
+        self.code_index = CodeIndex.CodeIndex()
+        self.codes = self.code_index.codes  # 종목코드 -> 기업명
+        self.price_cache = PriceCache.PriceCache(cache_rows)
+        self.version_check_secs = version_check_secs
+        self.version_checked = None
+        self.version_task = None
+        self.versions = dict()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def connect(self):
+        """커넥션 풀을 만들고 종목코드 색인을 읽음 (여러 번 불러도 한 번만 생성)"""
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            if self.pool is None:
+                self.pool = await aiomysql.create_pool(minsize=self.minsize,
+                    maxsize=self.maxsize, autocommit=False,
+                    **DBPool.DB_PARAMS)
+        await self.check_version()
+
+    async def close(self):
+        """커넥션 풀의 연결을 모두 닫음"""
+        if self.pool is not None:
+            self.pool.close()
+            await self.pool.wait_closed()
+            self.pool = None
+
+    async def fetchall(self, sql, params=None):
+        """풀에서 연결을 빌려 sql 을 실행하고 전체 행을 반환"""
+        if self.pool is None:
+            await self.connect()
+        async with self.pool.acquire() as conn:
+            try:
+                async with conn.cursor() as curs:
+                    await curs.execute(sql, params)
+                    return await curs.fetchall()
+            finally:
+                await conn.commit()
+
+    async def get_comp_info(self):
+        """company_info 테이블에서 읽어와서 codes와 이름 색인에 저장
+        (다시 호출하면 바뀐 종목만 색인에 반영)"""
+        rows = await self.fetchall("SELECT code, company FROM company_info")
+        return self.code_index.update(dict(rows))
+
+    async def check_version(self):
+        """DBUpdater 가 올린 데이터 버전이 바뀌었으면 반영 (MarketDB 와 같음)
+        확인 중에 들어온 다른 조회는 같은 확인이 끝나기를 기다린다."""
+        now = datetime.now()
+        task = self.version_task
+        if task is None or (task.done() and (task.exception() is not None or
+                (now - self.version_checked).total_seconds() >=
+                self.version_check_secs)):
+            # 처음이거나 직전 확인이 실패했으면 종목 색인도 읽음
+            first_check = task is None or task.exception() is not None
+            self.version_checked = now
+            task = asyncio.ensure_future(self.read_versions(first_check))
+            self.version_task = task
+        await task
+
+    async def read_versions(self, first_check):
+        """data_version 테이블을 읽어서 캐시와 종목 색인에 반영"""
+        try:
+            versions = dict(await self.fetchall(
+                "SELECT name, version FROM data_version"))
+        except pymysql.err.ProgrammingError:
+            versions = dict()  # data_version 테이블이 아직 없음
+
+        version = versions.get('daily_price', 0)
+        if version != self.price_cache.version:
+            self.price_cache.clear(version)
+        version = versions.get('company_info', 0)
+        if first_check or version != self.versions.get('company_info', 0):
+            await self.get_comp_info()
+        self.versions = versions
+
+    async def find_codes(self, text, limit=10):
+        """기업명 일부('삼성', '하이닉')로 (종목코드, 기업명) 후보 리스트 반환"""
+        await self.check_version()
+        return self.code_index.search(text, limit)
+
+    async def get_daily_price(self, code, start_date=None, end_date=None):
+        """KRX 종목의 일별 시세를 데이터프레임 형태로 반환 (MarketDB 와 같음)
+            - code       : KRX 종목코드('005930') 또는 상장기업명('삼성전자')
+            - start_date : 조회 시작일('2020-01-01'), 미입력 시 1년 전 오늘
+            - end_date   : 조회 종료일('2020-12-31'), 미입력 시 오늘 날짜
+        """
+        dates = Analyzer.normalize_dates(start_date, end_date)
+        if dates is None:
+            return
+        start_date, end_date = dates
+
+        await self.check_version()
+        resolved = self.code_index.resolve(code)
+        if resolved is None:
+            print(f"ValueError: Code({code}) doesn't exist.")
+        else:
+            code = resolved
+        if self.price_cache.max_rows <= 0:
+            return await self.read_daily_price(code, start_date, end_date)
+
+        # 캐시에 없는 구간을 먼저 비동기로 읽어 두고, 기다리는 동안 다른
+        # 조회가 캐시를 바꿨으면 그만큼 다시 읽은 뒤 캐시에 합친다
+        loaded = dict()
+        while True:
+            ranges = [r for r in self.price_cache.missing(code, start_date,
+                end_date) if r not in loaded]
+            if not ranges:
+                break
+            frames = await asyncio.gather(*[self.read_daily_price(code,
+                start, end) for start, end in ranges])
+            loaded.update(zip(ranges, frames))
+        return self.price_cache.get(code, start_date, end_date,
+            lambda code, start, end: loaded[(start, end)])
+
+    async def read_daily_price(self, code, start_date, end_date):
+        """daily_price 테이블에서 code 의 start_date ~ end_date 시세를 읽음
+        (FastQuery 와 같은 쿼리로 int64 배열에 바로 채움)"""
+        count_sql, rows_sql, params, fields, dtype = FastQuery.build_queries(
+            [code], start_date, end_date)
+        if self.pool is None:
+            await self.connect()
+        async with self.pool.acquire() as conn:
+            try:
+                async with conn.cursor() as curs:
+                    await curs.execute(count_sql, params)
+                    counts = await curs.fetchall()
+                buf = FastQuery.FrameBuffer(counts, fields, dtype)
+                if buf.total > 0:
+                    async with conn.cursor(aiomysql.SSCursor) as curs:
+                        await curs.execute(rows_sql, params)
+                        while True:
+                            rows = await curs.fetchmany(self.chunk_rows)
+                            if not rows or not buf.add(rows):
+                                break
+            finally:
+                await conn.commit()
+        df = buf.frame('daily_price')
+        df.index = pd.DatetimeIndex(df['date'], name='date')
+        return df
+
+    async def get_cross_section(self, dates, fields=('close',)):
+        """특정 거래일의 전 종목 시세를 한 번에 읽어서 반환 (MarketDB 와 같음)
+            - dates  : 조회일('2024-01-02') 또는 조회일 리스트
+            - fields : 읽을 열 ('open', 'high', 'low', 'close', 'diff', 'volume')
+        """
+        sql, params, fields = Analyzer.cross_section_query(dates, fields)
+        await self.check_version()
+        rows = await self.fetchall(sql, params)
+        df = pd.DataFrame(list(rows), columns=['date', 'code'] + fields)
+        return Analyzer.cross_section_frame(df, isinstance(dates, str),
+            self.codes)
+
+    def cache_info(self):
+        """시세 캐시의 적중/미적중 통계"""
+        return self.price_cache.info()
+
+
+async def main(codes):
+    """여러 종목의 시세를 한 이벤트 루프에서 동시에 읽는 예제"""
+    async with AsyncMarketDB() as mk:
+        t0 = time.perf_counter()
+        frames = await asyncio.gather(*[mk.get_daily_price(code,
+            '2024-01-02') for code in codes])
+        elapsed = time.perf_counter() - t0
+        for code, df in zip(codes, frames):
+            print(f"{code} : {0 if df is None else len(df)} rows")
+        print(f"{len(codes)} codes in {elapsed:.3f} sec")
+
+if __name__ == '__main__':
+    asyncio.run(main(sys.argv[1:] or ['삼성전자', 'SK하이닉스', 'NAVER',
+        '현대자동차', '엔씨소프트']))
@@ -0,0 +1,101 @@
+from datetime import datetime
+
+class Checkpoint:
+    def __init__(self, conn):
+        """생성자: 종목별 진행 상황을 기록하는 update_checkpoint 테이블 생성
+            - status      : pending(아직 안 함 또는 재시도 대기), done(완료),
+                            failed(재시도를 모두 써도 실패)
+            - run_started : 행을 기록한 실행의 시작 시각 (실행 구분용)
+        """
+        self.conn = conn
+        with self.conn.cursor() as curs:
+            sql = """
+            CREATE TABLE IF NOT EXISTS update_checkpoint (
+                code VARCHAR(20),
+                status VARCHAR(10),
+                last_page INT,
+                last_date DATE,
+                attempts INT,
+                error VARCHAR(255),
+                updated DATETIME,
+                run_started DATETIME,
+                PRIMARY KEY (code))
+            """
+            curs.execute(sql)
+            # 이전 버전에서 만든 테이블에는 실행 시작 시각 컬럼 추가 (MariaDB 문법)
+            sql = "ALTER TABLE update_checkpoint ADD COLUMN IF NOT EXISTS "\
+                "run_started DATETIME"
+            curs.execute(sql)
+        self.conn.commit()
+
+    def begin(self, codes):
+        """이번 실행에서 처리할 종목코드 리스트를 반환
+            - codes 중에 오늘 시작한 실행의 pending 종목이 남아 있으면 그 실행이
+              중단된 것으로 보고, 그 실행에서 done 이 된 종목만 빼고 이어서 처리
+              (재시도 대기 중인 종목은 fail() 이 pending 으로 남기므로 재시도
+              단계에서 중단돼도 이어감)
+            - 다른 날 시작한 실행이나 다른 샤드 실행에서 done 이 된 종목은 믿지
+              않고 다시 처리
+            - 중단된 실행이 없으면 새 실행으로 보고 codes 전체를 pending 으로 초기화
+            (codes 범위 안에서만 판단하므로 샤드별로 독립적으로 재시작 가능)
+        """
+        now = datetime.now().replace(microsecond=0)
+        sql = """
+            REPLACE INTO update_checkpoint (code, status, last_page, last_date,
+                attempts, error, updated, run_started)
+            VALUES (%s, 'pending', NULL, NULL, 0, NULL, %s, %s)
+        """
+        with self.conn.cursor() as curs:
+            curs.execute("SELECT code, status, run_started "\
+                "FROM update_checkpoint")
+            wanted = set(codes)
+            rows = {code: (st, run) for code, st, run in curs.fetchall()
+                if code in wanted}
+            interrupted = [run for st, run in rows.values()
+                if st == 'pending' and run is not None]
+            run = max(interrupted) if interrupted else None
+            if run is not None and run.date() == now.date():
+                todo = [code for code in codes
+                    if rows.get(code) != ('done', run)]
+                # 중단 이후 새로 상장됐거나 이 실행에서 처리하지 않은 종목도
+                # 이 실행의 pending 으로 추가
+                curs.executemany(sql, [(code, now, run) for code in todo
+                    if rows.get(code) != ('pending', run)])
+                self.conn.commit()
+                print(f"Resuming interrupted update ({run}) : "\
+                    f"{len(codes) - len(todo)} codes done, "\
+                    f"{len(todo)} codes left")
+                return todo
+
+            curs.executemany(sql, [(code, now, now) for code in codes])
+        self.conn.commit()
+        return list(codes)
+
+    def done(self, code, last_page, last_date):
+        """종목의 완료와 마지막으로 읽은 페이지, 날짜를 기록"""
+        with self.conn.cursor() as curs:
+            sql = """
+                UPDATE update_checkpoint SET status = 'done', last_page = %s,
+                last_date = COALESCE(%s, last_date), error = NULL, updated = %s
+                WHERE code = %s
+            """
+            curs.execute(sql, (last_page, last_date, datetime.now(), code))
+        self.conn.commit()
+
+    def fail(self, code, error, final=True):
+        """종목의 실패와 오류 메시지를 기록하고 누적 시도 횟수를 반환
+            - final : False 이면 다시 시도할 종목이므로 pending 으로 남김
+        """
+        with self.conn.cursor() as curs:
+            sql = """
+                UPDATE update_checkpoint SET status = %s,
+                attempts = attempts + 1, error = %s, updated = %s
+                WHERE code = %s
+            """
+            curs.execute(sql, ('failed' if final else 'pending',
+                str(error)[:255], datetime.now(), code))
+            curs.execute("SELECT attempts FROM update_checkpoint "\
+                "WHERE code = %s", (code,))
+            rs = curs.fetchone()
+        self.conn.commit()
+        return rs[0] if rs else 1
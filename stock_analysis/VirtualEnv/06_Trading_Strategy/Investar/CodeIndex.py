@@ -0,0 +1,65 @@
+import bisect
+import difflib
+
+class CodeIndex:
+    def __init__(self):
+        """생성자: 종목코드 <-> 기업명 양방향 딕셔너리와 이름 정렬 배열
+            - codes : 종목코드 -> 기업명 (MarketDB.codes 와 같은 딕셔너리)
+            - names : 기업명 -> 종목코드
+            - sorted_names : 접두어 검색용으로 정렬한 기업명 리스트
+        """
+        self.codes = dict()
+        self.names = dict()
+        self.sorted_names = []
+
+    def update(self, codes):
+        """새 종목코드 딕셔너리와 비교해서 추가/변경/삭제된 종목만 반영
+            리턴값: 반영한 종목 수
+        """
+        removed = [code for code in self.codes if code not in codes]
+        changed = [code for code, name in codes.items()
+            if self.codes.get(code) != name]
+        for code in removed + changed:
+            name = self.codes.pop(code, None)
+            if name is not None and self.names.get(name) == code:
+                del self.names[name]
+                idx = bisect.bisect_left(self.sorted_names, name)
+                if idx < len(self.sorted_names) and \
+                    self.sorted_names[idx] == name:
+                    del self.sorted_names[idx]
+        for code in changed:
+            name = codes[code]
+            self.codes[code] = name
+            if name not in self.names:
+                bisect.insort(self.sorted_names, name)
+            self.names[name] = code
+        return len(removed) + len(changed)
+
+    def resolve(self, key):
+        """종목코드나 기업명을 종목코드로 변환 (없으면 None)"""
+        if key in self.codes:
+            return key
+        return self.names.get(key)
+
+    def prefix(self, text, limit=10):
+        """text 로 시작하는 기업명을 가나다순으로 최대 limit 개 반환"""
+        result = []
+        idx = bisect.bisect_left(self.sorted_names, text)
+        while idx < len(self.sorted_names) and len(result) < limit and \
+            self.sorted_names[idx].startswith(text):
+            result.append(self.sorted_names[idx])
+            idx += 1
+        return result
+
+    def search(self, text, limit=10):
+        """기업명 일부로 종목 찾기: 접두어 -> 포함 -> 비슷한 이름 순서로
+        최대 limit 개의 (종목코드, 기업명) 리스트 반환"""
+        found = self.prefix(text, limit)
+        if len(found) < limit:
+            found += [name for name in self.sorted_names if text in name
+                and name not in found][:limit - len(found)]
+        if len(found) < limit:
+            found += [name for name in difflib.get_close_matches(text,
+                self.sorted_names, n=limit, cutoff=0.5)
+                if name not in found][:limit - len(found)]
+        return [(self.names[name], name) for name in found]
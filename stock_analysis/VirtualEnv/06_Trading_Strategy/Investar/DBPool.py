@@ -0,0 +1,84 @@
+import os
+import threading
+from contextlib import contextmanager
+from sqlalchemy import create_engine, text
+
+DB_PARAMS = {'host': 'localhost', 'user': 'root', 'password': 'doolman',
+    'db': 'INVESTAR', 'charset': 'utf8'}  # 비동기 드라이버(AsyncAnalyzer)도 사용
+DB_URL = 'mysql+pymysql://{user}:{password}@{host}/{db}?charset={charset}'\
+    .format(**DB_PARAMS)
+
+# 커넥션 풀 설정 (configure() 로 변경, config.json 의 db_pool 항목)
+POOL_SETTINGS = {
+    'pool_size': 5,        # 풀에 유지하는 연결 수
+    'max_overflow': 5,     # 풀이 모자랄 때 추가로 여는 최대 연결 수
+    'pool_timeout': 30,    # 빈 연결을 기다리는 최대 시간(초)
+    'pool_recycle': 3600,  # 이 시간(초)보다 오래된 연결은 다시 연결 (wait_timeout 대비)
+}
+
+engines = dict()  # (프로세스 ID, local_infile) -> 엔진
+lock = threading.Lock()
+
+def configure(**settings):
+    """풀 설정을 바꾸고 이미 만든 엔진은 닫아서 다음 사용 때 새 설정으로 만듦
+        - settings : pool_size, max_overflow, pool_timeout, pool_recycle
+    """
+    unknown = set(settings) - set(POOL_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown pool settings: {sorted(unknown)}")
+    if any(POOL_SETTINGS[key] != value for key, value in settings.items()):
+        POOL_SETTINGS.update(settings)
+        dispose()
+
+def get_engine(local_infile=False):
+    """이 프로세스가 함께 쓰는 SQLAlchemy 엔진을 반환 (처음 호출할 때 생성)
+        - local_infile : True 이면 LOAD DATA LOCAL INFILE 을 허용하는 연결 사용
+        엔진은 만들 때 연결하지 않고 첫 쿼리에서 연결하며, 꺼낼 때마다
+        pool_pre_ping 으로 끊긴 연결을 확인해서 다시 연결한다.
+        fork 된 자식 프로세스는 부모의 연결을 쓰지 않도록 따로 만든다.
+    """
+    key = (os.getpid(), local_infile)
+    with lock:
+        engine = engines.get(key)
+        if engine is None:
+            connect_args = {'local_infile': True} if local_infile else {}
+            engine = create_engine(DB_URL, pool_pre_ping=True,
+                connect_args=connect_args, **POOL_SETTINGS)
+            engines[key] = engine
+        return engine
+
+def raw_connection(local_infile=False):
+    """풀에서 pymysql 연결을 빌려서 반환 (close() 하면 풀로 반납)"""
+    return get_engine(local_infile).raw_connection()
+
+@contextmanager
+def connection(local_infile=False):
+    """with 블록 동안 풀에서 빌린 pymysql 연결을 쓰고 끝나면 반납"""
+    conn = raw_connection(local_infile)
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+def ping():
+    """DB 에 연결할 수 있으면 True"""
+    try:
+        with get_engine().connect() as conn:
+            conn.execute(text('SELECT 1'))
+        return True
+    except Exception:
+        return False
+
+def status():
+    """이 프로세스 엔진들의 풀 상태 문자열 리스트"""
+    pid = os.getpid()
+    with lock:
+        return [f"local_infile={key[1]} : {engine.pool.status()}"
+            for key, engine in engines.items() if key[0] == pid]
+
+def dispose():
+    """이 프로세스가 만든 엔진의 연결을 모두 닫음 (다음 사용 때 다시 생성)"""
+    pid = os.getpid()
+    with lock:
+        for key in [key for key in engines if key[0] == pid]:
+            engines.pop(key).dispose()
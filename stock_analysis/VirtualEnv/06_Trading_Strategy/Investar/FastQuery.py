@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pymysql
+
+PRICE_FIELDS = ['open', 'high', 'low', 'close', 'diff', 'volume']
+RETURN_FIELDS = ['adj_close', 'ret', 'log_ret', 'cum_index']
+
+# 테이블별 (읽을 수 있는 열, 배열 dtype), daily_return 의 NULL 은 NaN 이 된다
+TABLES = {
+    'daily_price': (PRICE_FIELDS, np.int64),
+    'daily_return': (RETURN_FIELDS, np.float64),
+}
+EPOCH_DAYS = 719528  # TO_DAYS('1970-01-01'), 날짜를 1970-01-01 기준 일수로 변환
+
+class FrameBuffer:
+    def __init__(self, counts, fields, dtype):
+        """생성자: 종목별 행 수(counts)만큼 미리 만든 배열에 행 묶음을 채우는 버퍼
+            - counts : (종목코드, 행 수) 리스트 (code 순서, 행은 code, date 순)
+            0 행은 날짜(일수), 1 행부터는 fields 순서 (열 방향으로 연속인 배열)
+        """
+        self.counts = counts
+        self.fields = fields
+        self.dtype = dtype
+        self.total = sum(count for _, count in counts)
+        self.buf = np.empty((len(fields) + 1, self.total), dtype=dtype)
+        self.pos = 0
+
+    def add(self, rows):
+        """커서에서 꺼낸 행 묶음을 배열에 채움 (센 것보다 많으면 False)"""
+        block = np.array(rows, dtype=self.dtype)
+        if self.pos + len(block) > self.total:
+            self.pos += len(block)  # 센 뒤에 행이 늘어남
+            return False
+        self.buf[:, self.pos:self.pos + len(block)] = block.T
+        self.pos += len(block)
+        return True
+
+    def frame(self, table):
+        """채운 배열로 (code, date, fields...) 데이터프레임 생성"""
+        if self.pos != self.total:
+            raise RuntimeError(f"{table} changed while reading "\
+                f"({self.total} rows counted, {self.pos} rows read)")
+        # buf[1:].T 는 복사 없이 하나의 블록이 되고 code, date 열만 새로 만든다
+        df = pd.DataFrame(self.buf[1:].T, columns=self.fields, copy=False)
+        days = self.buf[0].astype(np.int64, copy=False)
+        dates = days.astype('datetime64[D]').astype('datetime64[ns]')
+        df.insert(0, 'date', dates)
+        df.insert(0, 'code', np.repeat(np.array([code for code, _
+            in self.counts], dtype=object), [count for _, count
+            in self.counts]))
+        return df
+
+
+def build_queries(codes, start_date, end_date, fields=None,
+        table='daily_price'):
+    """read_prices() 의 (행 수 SQL, 행 SQL, 파라미터, 필드 리스트, dtype)
+    (AsyncMarketDB 도 같은 쿼리와 FrameBuffer 를 사용)"""
+    columns, dtype = TABLES[table]
+    fields = list(columns if fields is None else fields)
+    for field in fields:
+        if field not in columns:
+            raise ValueError(f"Field({field}) doesn't exist.")
+    params = {'codes': tuple(codes), 'start': start_date, 'end': end_date}
+    where = "WHERE code IN %(codes)s AND date >= %(start)s "\
+        "AND date <= %(end)s"
+    count_sql = f"SELECT code, COUNT(*) FROM {table} {where} "\
+        "GROUP BY code ORDER BY code"
+    rows_sql = f"SELECT TO_DAYS(date) - {EPOCH_DAYS}, "\
+        f"{', '.join(fields)} FROM {table} {where} ORDER BY code, date"
+    return count_sql, rows_sql, params, fields, dtype
+
+
+def read_prices(conn, codes, start_date, end_date, fields=None,
+        chunk_rows=10000, table='daily_price'):
+    """table 에서 codes 의 start_date ~ end_date 행을 읽어서
+    (code, date, fields...) 열의 데이터프레임으로 반환 (code, date 순 정렬)
+        - conn       : pymysql 연결 (DBPool.connection())
+        - codes      : 종목코드 리스트 (KRX 종목코드만, 기업명 변환은 호출한 쪽에서)
+        - fields     : 읽을 열 리스트 (None 이면 TABLES 의 전체 열)
+        - chunk_rows : 커서에서 한 번에 꺼내는 행 수
+        - table      : 'daily_price'(int64) 또는 'daily_return'(float64)
+        종목별 행 수를 먼저 세어 배열을 정확한 크기로 한 번만 만들고,
+        날짜도 정수(일수)로 받아서 행 묶음을 배열에 바로 채운다. 두 쿼리는
+        같은 트랜잭션이라 같은 스냅숏을 본다 (REPEATABLE READ).
+    """
+    count_sql, rows_sql, params, fields, dtype = build_queries(codes,
+        start_date, end_date, fields, table)
+    counts = ()
+    if codes:
+        with conn.cursor() as curs:
+            curs.execute(count_sql, params)
+            counts = curs.fetchall()
+
+    buf = FrameBuffer(counts, fields, dtype)
+    if buf.total > 0:
+        with conn.cursor(pymysql.cursors.SSCursor) as curs:
+            curs.execute(rows_sql, params)
+            while True:
+                rows = curs.fetchmany(chunk_rows)
+                if not rows or not buf.add(rows):
+                    break
+    conn.commit()
+    return buf.frame(table)
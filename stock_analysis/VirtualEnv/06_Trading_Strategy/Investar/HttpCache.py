@@ -0,0 +1,120 @@
+import os
+import gzip
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime
+from urllib.parse import urlparse
+
+# 호스트별 유효 기간: 'daily' 는 받은 날 하루 동안, 숫자는 초 단위.
+# 네이버 sise_day 는 새 거래일이 생길 때마다 페이지 번호가 한 칸씩 밀리므로
+# 같은 URL 이라도 날짜가 바뀌면 내용이 달라져서 하루 단위로만 재사용한다.
+DEFAULT_TTL = {
+    'kind.krx.co.kr': 'daily',     # KRX 상장법인 목록
+    'finance.naver.com': 'daily',  # 네이버 일별 시세 페이지
+}
+
+class HttpCache:
+    def __init__(self, root='http_cache', offline=False, ttl=None):
+        """생성자: URL 별 응답 본문을 gzip 으로 압축해서 root 폴더에 저장하는 캐시
+            - offline : True 이면 네트워크 없이 캐시에 있는 응답만 사용
+            - ttl     : DEFAULT_TTL 을 덮어쓸 호스트별 유효 기간 딕셔너리
+        """
+        self.root = root
+        self.offline = offline
+        self.ttl = dict(DEFAULT_TTL)
+        if ttl:
+            self.ttl.update(ttl)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        os.makedirs(self.root, exist_ok=True)
+
+    def paths(self, url):
+        """url 의 (본문 파일, 메타 파일) 경로"""
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        folder = os.path.join(self.root, key[:2])
+        return os.path.join(folder, key + '.gz'), \
+            os.path.join(folder, key + '.json')
+
+    def is_fresh(self, url, meta):
+        """저장된 응답이 호스트별 유효 기간 안에 있으면 True"""
+        ttl = self.ttl.get(urlparse(url).netloc, 0)
+        if ttl == 'daily':
+            fetched = datetime.fromtimestamp(meta['fetched']).date()
+            return fetched == datetime.today().date()
+        return time.time() - meta['fetched'] < ttl
+
+    def load(self, url):
+        """저장된 (본문, 메타) 를 반환 (없으면 (None, None))"""
+        body_path, meta_path = self.paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as in_file:
+                meta = json.load(in_file)
+            with gzip.open(body_path, 'rt', encoding='utf-8') as in_file:
+                return in_file.read(), meta
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return None, None
+
+    def save(self, url, text, meta):
+        """본문과 메타를 임시 파일에 쓴 뒤 교체 (동시에 읽는 쪽이 깨진 파일을 보지 않도록)"""
+        body_path, meta_path = self.paths(url)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        if text is not None:
+            with gzip.open(body_path + suffix, 'wt', encoding='utf-8') as out:
+                out.write(text)
+            os.replace(body_path + suffix, body_path)
+        with open(meta_path + suffix, 'w', encoding='utf-8') as out:
+            json.dump(meta, out)
+        os.replace(meta_path + suffix, meta_path)
+
+    def decode(self, response):
+        """Content-Type 에 charset 이 없으면 본문에서 추정한 인코딩으로 디코딩"""
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = response.apparent_encoding
+        return response.text
+
+    def get(self, url, fetch):
+        """url 의 본문 문자열을 반환
+            - fetch : 요청 헤더 딕셔너리를 받아서 requests 응답을 돌려주는 함수
+            유효 기간이 지났으면 ETag/Last-Modified 로 재검증 후 304 이면 캐시 사용
+        """
+        text, meta = self.load(url)
+        if text is not None and (self.offline or self.is_fresh(url, meta)):
+            with self.lock:
+                self.hits += 1
+            return text
+        if self.offline:
+            raise LookupError(f"{url} is not cached (offline mode)")
+
+        headers = dict()
+        if text is not None and meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if text is not None and meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        response = fetch(headers)
+
+        if response.status_code == 304 and text is not None:
+            meta['fetched'] = time.time()
+            self.save(url, None, meta)
+            with self.lock:
+                self.revalidated += 1
+            return text
+
+        body = self.decode(response)
+        if response.status_code == 200:
+            self.save(url, body, {'url': url, 'fetched': time.time(),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')})
+        with self.lock:
+            self.misses += 1
+        return body
+
+    def report(self):
+        """캐시 적중/미적중/재검증 횟수 출력"""
+        print(f"HTTP cache ({self.root}{', offline' if self.offline else ''})"\
+            f" : {self.hits} hits, {self.misses} misses, "\
+            f"{self.revalidated} revalidated")
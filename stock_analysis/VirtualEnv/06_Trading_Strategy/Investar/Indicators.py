@@ -0,0 +1,320 @@
+import math
+import numpy as np
+import pandas as pd
+from collections import deque
+from numpy.lib.stride_tricks import sliding_window_view
+
+# 배치 함수는 전체 기간을 NumPy 로 한 번에 계산하고, 같은 지표의 클래스는
+# 새 봉이 들어올 때마다 update() 로 O(1) 갱신한다 (실시간 매매용).
+# 두 경로의 결과는 bench_indicators.py 로 같은지 확인한다.
+
+def as_array(values):
+    """Series, 리스트 등을 float64 배열로 변환"""
+    return np.asarray(values, dtype=np.float64)
+
+def like(source, values):
+    """source 가 Series 이면 같은 인덱스의 Series 로, 아니면 배열 그대로 반환"""
+    if isinstance(source, pd.Series):
+        return pd.Series(values, index=source.index)
+    return values
+
+def rolling_sum_array(values, window):
+    """window 구간 합 배열 (처음 window-1 개는 NaN)"""
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        result[window - 1:] = sliding_window_view(values, window).sum(axis=1)
+    return result
+
+
+# ---------------------------------------------------------------- 배치 함수
+
+def rolling_stats(close, window=20):
+    """이동평균과 표본 표준편차 (rolling(window).mean(), .std() 와 같음)
+    리턴값: (mean, std), 처음 window-1 개는 NaN"""
+    values = as_array(close)
+    mean = np.full(len(values), np.nan)
+    std = np.full(len(values), np.nan)
+    if len(values) >= window:
+        windows = sliding_window_view(values, window)
+        mean[window - 1:] = windows.mean(axis=1)
+        std[window - 1:] = windows.std(axis=1, ddof=1)
+    return like(close, mean), like(close, std)
+
+def bollinger(close, window=20, k=2):
+    """볼린저 밴드 (중심선, 상단, 하단, %b, 밴드폭 %)
+        - window : 이동평균 기간
+        - k      : 표준편차 배수
+    """
+    mean, std = rolling_stats(as_array(close), window)
+    upper = mean + std * k
+    lower = mean - std * k
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pb = (as_array(close) - lower) / (upper - lower)
+        bandwidth = (upper - lower) / mean * 100
+    return tuple(like(close, v) for v in (mean, upper, lower, pb, bandwidth))
+
+def ema(close, span):
+    """지수 이동평균 (ewm(span=span).mean() 과 같은 가중치 정규화 방식)
+    num_t = x_t + (1-a) num_(t-1), den_t = 1 + (1-a) den_(t-1) 의 점화식을
+    (1-a)^j 가 언더플로하지 않는 길이의 블록으로 나눠 누적합으로 푼다."""
+    values = as_array(close)
+    decay = 1 - 2 / (span + 1)
+    if decay <= 0:
+        return like(close, values.copy())  # span 1 이면 원래 값
+    result = np.empty(len(values))
+    block = max(1, int(200 / -math.log(decay)))
+    num = den = 0.0
+    for start in range(0, len(values), block):
+        chunk = values[start:start + block]
+        powers = decay ** np.arange(1, len(chunk) + 1)
+        # j 번째 값 = decay^(j+1) * (carry + sum_(i<=j) x_i / decay^(i+1))
+        nums = powers * (num + np.cumsum(chunk / powers))
+        dens = powers * (den + np.cumsum(1 / powers))
+        result[start:start + len(chunk)] = nums / dens
+        num, den = nums[-1], dens[-1]
+    return like(close, result)
+
+def macd(close, fast=12, slow=26, signal=9):
+    """MACD 선, 신호선, 히스토그램 (ema(fast) - ema(slow), 그 ema(signal))"""
+    line = ema(as_array(close), fast) - ema(as_array(close), slow)
+    sig = ema(line, signal)
+    return like(close, line), like(close, sig), like(close, line - sig)
+
+def stochastic(high, low, close, k_window=14, d_window=3):
+    """스토캐스틱 %K 와 %D
+    (rolling(k_window, min_periods=1) 최고/최저가 기준 %K, %D 는 %K 의 d_window 평균)"""
+    high, low, close_values = as_array(high), as_array(low), as_array(close)
+    pad = k_window - 1
+    highest = sliding_window_view(np.concatenate([np.full(pad, -np.inf),
+        high]), k_window).max(axis=1)
+    lowest = sliding_window_view(np.concatenate([np.full(pad, np.inf),
+        low]), k_window).min(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fast_k = (close_values - lowest) / (highest - lowest) * 100
+    slow_d = np.full(len(fast_k), np.nan)
+    if len(fast_k) >= d_window:
+        slow_d[d_window - 1:] = sliding_window_view(fast_k, d_window).sum(
+            axis=1) / d_window
+    return like(close, fast_k), like(close, slow_d)
+
+def money_flow(high, low, close, volume):
+    """중심가격(TP)이 전날보다 오른 날은 양, 아니면 음의 현금흐름 (첫날은 0)"""
+    tp = (as_array(high) + as_array(low) + as_array(close)) / 3
+    flow = tp * as_array(volume)
+    up = np.zeros(len(tp), dtype=bool)
+    up[1:] = tp[:-1] < tp[1:]
+    first = np.arange(len(tp)) == 0
+    return np.where(up, flow, 0.0), np.where(up | first, 0.0, flow)
+
+def mfi(high, low, close, volume, window=10):
+    """현금흐름지표 MFI (양의 현금흐름 합 / 음의 현금흐름 합 기준 0~100)"""
+    positive, negative = money_flow(high, low, close, volume)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = rolling_sum_array(positive, window) / \
+            rolling_sum_array(negative, window)
+        result = 100 - 100 / (1 + ratio)
+    return like(close, result)
+
+def intraday_intensity(high, low, close, volume):
+    """일중강도 II = (2 x 종가 - 고가 - 저가) / (고가 - 저가) x 거래량
+    (고가와 저가가 같은 날은 0 으로 봄)"""
+    high, low = as_array(high), as_array(low)
+    spread = high - low
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = (2 * as_array(close) - high - low) / spread * \
+            as_array(volume)
+    result[spread == 0] = 0.0
+    return result
+
+def iip(high, low, close, volume, window=21):
+    """일중강도율 II% (window 동안 II 합 / 거래량 합 x 100)"""
+    ii = intraday_intensity(high, low, close, volume)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = rolling_sum_array(ii, window) / \
+            rolling_sum_array(as_array(volume), window) * 100
+    return like(close, result)
+
+
+# ------------------------------------------------------- 스트리밍 클래스
+
+class RollingSum:
+    def __init__(self, window):
+        """생성자: 최근 window 개 값의 합 (window 번마다 합을 새로 더해서 오차 누적 방지)"""
+        self.window = window
+        self.values = deque()
+        self.total = 0.0
+        self.count = 0
+
+    def update(self, value):
+        """값을 추가하고 합을 반환 (window 개가 모이기 전에는 NaN)"""
+        self.values.append(value)
+        self.total += value
+        if len(self.values) > self.window:
+            self.total -= self.values.popleft()
+        self.count += 1
+        if self.count % self.window == 0:
+            self.total = math.fsum(self.values)
+        return self.total if len(self.values) == self.window else math.nan
+
+
+class RollingStats:
+    def __init__(self, window=20):
+        """생성자: 최근 window 개 값의 평균과 표본 분산 (Welford 갱신)
+        가격대가 크게 바뀌면 오차가 남으므로 window 번마다 두 번 훑어서 다시 계산"""
+        self.window = window
+        self.count = 0
+        self.values = deque()
+        self.mean = math.nan
+        self.std = math.nan
+        self.avg = 0.0
+        self.m2 = 0.0  # 평균과의 차이 제곱합
+
+    def update(self, value):
+        """값을 추가하고 (mean, std) 반환 (window 개가 모이기 전에는 NaN)"""
+        self.values.append(value)
+        if len(self.values) > self.window:
+            # 가장 오래된 값을 새 값으로 바꾼 것과 같은 Welford 갱신
+            old = self.values.popleft()
+            avg = self.avg + (value - old) / self.window
+            self.m2 += (value - old) * (value - avg + old - self.avg)
+            self.avg = avg
+        else:
+            delta = value - self.avg
+            self.avg += delta / len(self.values)
+            self.m2 += delta * (value - self.avg)
+        self.count += 1
+        if self.count % self.window == 0:
+            self.avg = math.fsum(self.values) / len(self.values)
+            self.m2 = math.fsum((x - self.avg) ** 2 for x in self.values)
+        if len(self.values) < self.window:
+            return self.mean, self.std
+        self.mean = self.avg
+        self.std = math.sqrt(max(self.m2, 0.0) / (self.window - 1)) \
+            if self.window > 1 else math.nan
+        return self.mean, self.std
+
+
+class Bollinger:
+    def __init__(self, window=20, k=2):
+        """생성자: 볼린저 밴드 (bollinger() 의 스트리밍 버전)"""
+        self.k = k
+        self.stats = RollingStats(window)
+
+    def update(self, close):
+        """종가를 추가하고 (중심선, 상단, 하단, %b, 밴드폭 %) 반환"""
+        mean, std = self.stats.update(close)
+        upper = mean + std * self.k
+        lower = mean - std * self.k
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pb = np.float64(close - lower) / (upper - lower)
+            bandwidth = np.float64(upper - lower) / mean * 100
+        return mean, upper, lower, float(pb), float(bandwidth)
+
+
+class EMA:
+    def __init__(self, span):
+        """생성자: 지수 이동평균 (ema() 의 스트리밍 버전)"""
+        self.decay = 1 - 2 / (span + 1)
+        self.num = 0.0
+        self.den = 0.0
+        self.value = math.nan
+
+    def update(self, value):
+        """값을 추가하고 지수 이동평균 반환"""
+        self.num = value + self.decay * self.num
+        self.den = 1 + self.decay * self.den
+        self.value = self.num / self.den
+        return self.value
+
+
+class MACD:
+    def __init__(self, fast=12, slow=26, signal=9):
+        """생성자: MACD (macd() 의 스트리밍 버전)"""
+        self.fast = EMA(fast)
+        self.slow = EMA(slow)
+        self.signal = EMA(signal)
+
+    def update(self, close):
+        """종가를 추가하고 (MACD 선, 신호선, 히스토그램) 반환"""
+        line = self.fast.update(close) - self.slow.update(close)
+        sig = self.signal.update(line)
+        return line, sig, line - sig
+
+
+class RollingExtreme:
+    def __init__(self, window, highest=True):
+        """생성자: 최근 window 개 중 최댓값(또는 최솟값), 단조 deque 로 분할 상환 O(1)"""
+        self.window = window
+        self.sign = 1 if highest else -1
+        self.items = deque()  # (순번, 부호를 곱한 값), 값이 감소하는 순서
+        self.count = 0
+
+    def update(self, value):
+        """값을 추가하고 구간 최댓값(최솟값) 반환 (모이기 전에도 있는 값으로 계산)"""
+        key = self.sign * value
+        while self.items and self.items[-1][1] <= key:
+            self.items.pop()
+        self.items.append((self.count, key))
+        if self.items[0][0] <= self.count - self.window:
+            self.items.popleft()
+        self.count += 1
+        return self.sign * self.items[0][1]
+
+
+class Stochastic:
+    def __init__(self, k_window=14, d_window=3):
+        """생성자: 스토캐스틱 %K, %D (stochastic() 의 스트리밍 버전)"""
+        self.d_window = d_window
+        self.highest = RollingExtreme(k_window, True)
+        self.lowest = RollingExtreme(k_window, False)
+        self.fast_k = deque(maxlen=d_window)
+
+    def update(self, high, low, close):
+        """봉을 추가하고 (%K, %D) 반환"""
+        highest = self.highest.update(high)
+        lowest = self.lowest.update(low)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fast_k = float(np.float64(close - lowest) / (highest - lowest) *
+                100)
+        self.fast_k.append(fast_k)
+        slow_d = math.nan
+        if len(self.fast_k) == self.d_window:
+            slow_d = sum(self.fast_k) / self.d_window
+        return fast_k, slow_d
+
+
+class MFI:
+    def __init__(self, window=10):
+        """생성자: 현금흐름지표 (mfi() 의 스트리밍 버전)"""
+        self.positive = RollingSum(window)
+        self.negative = RollingSum(window)
+        self.prev_tp = None
+
+    def update(self, high, low, close, volume):
+        """봉을 추가하고 MFI 반환"""
+        tp = (high + low + close) / 3
+        flow = tp * volume
+        up = self.prev_tp is not None and self.prev_tp < tp
+        negative = 0.0 if up or self.prev_tp is None else flow
+        self.prev_tp = tp
+        positive = self.positive.update(flow if up else 0.0)
+        negative = self.negative.update(negative)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.float64(positive) / negative
+            return float(100 - 100 / (1 + ratio))
+
+
+class IIP:
+    def __init__(self, window=21):
+        """생성자: 일중강도율 II% (iip() 의 스트리밍 버전)"""
+        self.intensity = RollingSum(window)
+        self.volume = RollingSum(window)
+
+    def update(self, high, low, close, volume):
+        """봉을 추가하고 II% 반환"""
+        spread = high - low
+        ii = (2 * close - high - low) / spread * volume if spread != 0 else 0.0
+        intensity = self.intensity.update(ii)
+        volume = self.volume.update(volume)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return float(np.float64(intensity) / volume * 100)
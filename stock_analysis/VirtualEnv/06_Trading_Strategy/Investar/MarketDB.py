@@ -1,17 +1,17 @@
 import pandas as pd
-import pymysql
 from datetime import datetime
 
+try:
+    from Investar import DBPool
+except ImportError:
+    import DBPool
+
 class MarketDB:
     def __init__(self):
-        """생성자: MariaDB 연결 및 종목코드 딕셔너리 생성"""
-        self.conn = pymysql.connect(host='localhost', user='root', password='doolman', db='INVESTAR', charset='utf8')
+        """생성자: 공유 커넥션 풀 엔진 및 종목코드 딕셔너리 생성"""
+        self.conn = DBPool.get_engine()
         self.codes = dict()
         self.getCompanyInfo()
-        
-    def __del__(self):
-        """소멸자: MariaDB 연결 해제"""
-        self.conn.close()
 
     def getCompanyInfo(self):
         """company_info 테이블에서 읽어와서 companyData와 codes에 저장"""
@@ -0,0 +1,141 @@
+import numpy as np
+import pandas as pd
+
+def period_returns(old_price, new_price):
+    """시작 종가 대비 종료 종가 수익률(%) 배열
+        - old_price : 종목별 시작일 종가 배열
+        - new_price : 종목별 종료일 종가 배열 (같은 순서)
+        시세가 없거나(NaN) 시작 종가가 0 이하인 종목은 NaN
+    """
+    old_price = np.asarray(old_price, dtype=np.float64)
+    new_price = np.asarray(new_price, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = (new_price / old_price - 1) * 100
+    returns[~(old_price > 0)] = np.nan
+    return returns
+
+def top_n(values, n):
+    """values 가 큰 순서로 n 개의 인덱스 (NaN 제외)
+    argpartition 으로 상위 n 개만 골라낸 뒤 그 n 개만 정렬한다
+    (n 이 None 이거나 유효한 값 수보다 크면 유효한 값 전체를 정렬)"""
+    values = np.asarray(values, dtype=np.float64)
+    valid = np.flatnonzero(~np.isnan(values))
+    if n is None or n >= len(valid):
+        picked = valid
+    elif n <= 0:
+        return valid[:0]
+    else:
+        picked = valid[np.argpartition(-values[valid], n - 1)[:n]]
+    # 수익률이 같으면 앞쪽(종목코드순) 종목이 먼저
+    return picked[np.lexsort((picked, -values[picked]))]
+
+def fill_forward(index):
+    """(거래일 x 종목) 배열의 NaN 을 종목별 직전 값으로 채움
+    (거래정지일은 직전 값 유지, 상장 전 구간은 NaN 그대로)"""
+    index = np.asarray(index, dtype=np.float64)
+    rows = np.where(np.isnan(index), 0, np.arange(len(index))[:, None])
+    rows = np.maximum.accumulate(rows, axis=0)
+    return index[rows, np.arange(index.shape[1])]
+
+def backtest(index, lookback, hold, stock_count, start=None, min_return=0.0,
+        cost=0.0, fill=True):
+    """듀얼 모멘텀 리밸런싱을 전 기간에 대해 한 번에 계산 (walk-forward)
+        - index       : (거래일 x 종목) 누적 수익 지수 배열 (daily_return 의 cum_index)
+        - lookback    : 모멘텀을 구하는 과거 거래일 수
+        - hold        : 보유 거래일 수 (리밸런싱 간격)
+        - stock_count : 상대 모멘텀으로 고르는 종목수 (종목마다 1/stock_count 비중)
+        - start       : 첫 리밸런싱 행 번호 (None 이면 lookback)
+        - min_return  : 절대 모멘텀 기준 (lookback 수익률이 이 값 이하인 자리는 현금)
+        - cost        : 회전율 1 당 거래비용 비율 (0.003 이면 0.3%)
+        - fill        : False 이면 index 가 이미 fill_forward() 된 것으로 보고 복사 안 함
+        리밸런싱일마다 lookback 전 대비 수익률 상위 stock_count 종목을 고르고
+        (상대 모멘텀), 그 중 수익률이 min_return 을 넘는 종목만 보유한다
+        (절대 모멘텀). 보유 기간 동안은 비중을 조정하지 않는다.
+        리턴값: dict
+            equity    : 첫 리밸런싱일을 1 로 하는 일별 평가액 배열
+            days      : equity 의 행 번호 배열
+            rebalance : 리밸런싱일 행 번호 배열 (K)
+            holdings  : (K x stock_count) 보유 종목 열 번호 (현금 자리는 -1)
+            momentum  : (K x stock_count) 고른 종목들의 lookback 수익률
+            returns   : 기간별 수익률 (거래비용 차감 후)
+            turnover  : 기간별 회전율 (0.5 x 비중 변화 합, 현금 포함)
+    """
+    if fill:
+        index = fill_forward(index)
+    n_days, n_codes = index.shape
+    count = min(stock_count, n_codes)
+    start = lookback if start is None else max(start, lookback)
+    rebalance = np.arange(start, n_days - 1, hold)
+    if count <= 0 or len(rebalance) == 0:
+        raise ValueError(f"Not enough data for lookback({lookback}) and "\
+            f"hold({hold}) : {n_days} days x {n_codes} codes")
+    periods = np.arange(len(rebalance))[:, None]
+
+    # 상대 모멘텀: 리밸런싱일마다 lookback 수익률 상위 count 개
+    now = index[rebalance]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        momentum = now / index[rebalance - lookback] - 1
+    momentum[~np.isfinite(momentum)] = np.nan
+    key = np.where(np.isnan(momentum), -np.inf, momentum)
+    top = np.argpartition(-key, count - 1, axis=1)[:, :count]
+    top = np.take_along_axis(top, np.argsort(-np.take_along_axis(key, top,
+        axis=1), axis=1, kind='stable'), axis=1)
+    momentum = momentum[periods, top]
+
+    # 절대 모멘텀: 기준을 넘지 못한 자리는 현금 (NaN 비교는 False)
+    held = momentum > min_return
+
+    # 보유 기간의 일별 종목 가치 (리밸런싱일 = 1)
+    days = rebalance[:, None] + np.arange(hold + 1)
+    inside = days < n_days
+    days = np.minimum(days, n_days - 1)
+    growth = index[days[:, :, None], top[:, None, :]] / \
+        now[periods, top][:, None, :]
+    growth = np.where(held[:, None, :], growth, 1.0)
+    value = growth.mean(axis=2)  # 기간 시작 대비 포트폴리오 가치
+
+    # 회전율: 직전 기간 말 (가치 변동이 반영된) 비중 -> 새 목표 비중
+    slots = np.where(held, top, n_codes)  # 마지막 열은 현금
+    target = np.zeros((len(rebalance), n_codes + 1))
+    np.add.at(target, (periods, slots), 1.0 / count)
+    drifted = np.zeros((len(rebalance) + 1, n_codes + 1))
+    drifted[0, n_codes] = 1.0  # 처음에는 현금
+    np.add.at(drifted[1:], (periods, slots),
+        growth[:, -1, :] / count / value[:, -1:])
+    turnover = 0.5 * np.abs(target - drifted[:-1]).sum(axis=1)
+
+    net = value * (1 - cost * turnover)[:, None]
+    equity_start = np.concatenate([[1.0], np.cumprod(net[:, -1])[:-1]])
+    curve = equity_start[:, None] * net[:, 1:]
+    return {
+        'equity': np.concatenate([[1.0], curve[inside[:, 1:]]]),
+        'days': np.concatenate([rebalance[:1], days[:, 1:][inside[:, 1:]]]),
+        'rebalance': rebalance,
+        'holdings': np.where(held, top, -1),
+        'momentum': momentum,
+        'returns': net[:, -1] - 1,
+        'turnover': turnover,
+    }
+
+def load_index(mk, start_date, end_date, lookback):
+    """백테스트용 전 종목 누적 수익 지수를 한 번의 조회로 읽음
+        - mk         : Analyzer.MarketDB
+        - start_date : 첫 리밸런싱일 (이후 첫 거래일로 보정)
+        - end_date   : 종료일 (이전 마지막 거래일로 보정)
+        - lookback   : 첫 리밸런싱일 앞으로 더 읽을 거래일 수
+        리턴값: (거래일 DatetimeIndex, 종목코드 리스트, (거래일 x 종목) 배열,
+                첫 리밸런싱일 행 번호), 기간에 거래일이 없으면 None
+    """
+    calendar = mk.calendar
+    first_day = calendar.next_day(start_date)
+    last_day = calendar.prev_day(end_date)
+    if first_day is None or last_day is None or first_day > last_day:
+        return None
+    load_day = calendar.offset(first_day, -lookback) or str(calendar.days[0])
+    days = pd.DatetimeIndex(calendar.range(load_day, last_day).astype(
+        'datetime64[ns]'), name='date')
+    codes = list(mk.codes)
+    index = mk.get_daily_returns(codes, load_day, last_day,
+        fields=('cum_index',)).reindex(index=days, columns=codes)
+    return days, codes, index.values, days.searchsorted(
+        pd.Timestamp(first_day))
@@ -0,0 +1,136 @@
+import time
+import argparse
+import itertools
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from Investar import Analyzer, Momentum
+except ImportError:
+    import Analyzer, Momentum
+
+METRICS = ['total', 'cagr', 'mdd', 'sharpe', 'turnover']
+
+shared = None  # 워커 프로세스가 붙인 (SharedMemory, 누적 수익 지수 배열)
+
+def attach(name, shape):
+    """워커 초기화: 부모가 만든 공유 메모리를 복사 없이 배열로 붙임"""
+    global shared
+    memory = shared_memory.SharedMemory(name=name)
+    shared = (memory, np.ndarray(shape, dtype=np.float64, buffer=memory.buf))
+
+def metrics(result, days_per_year=252):
+    """Momentum.backtest() 결과의 성과 지표 딕셔너리
+        - total, cagr, mdd : 누적 수익률, 연환산 수익률, 최대 낙폭 (%)
+        - sharpe           : 일간 수익률 기준 연환산 샤프 지수 (무위험 수익률 0)
+        - turnover         : 리밸런싱 평균 회전율
+    """
+    equity = result['equity']
+    daily = equity[1:] / equity[:-1] - 1
+    years = len(daily) / days_per_year
+    std = daily.std()
+    return {
+        'total': (equity[-1] - 1) * 100,
+        'cagr': (equity[-1] ** (1 / years) - 1) * 100 if years > 0 else 0.0,
+        'mdd': (equity / np.maximum.accumulate(equity) - 1).min() * 100,
+        'sharpe': daily.mean() / std * np.sqrt(days_per_year) if std > 0
+            else 0.0,
+        'turnover': result['turnover'].mean(),
+    }
+
+def run(params, start, min_return, cost):
+    """워커에서 파라미터 조합 하나를 백테스트 (공유 배열 사용)"""
+    lookback, hold, stock_count = params
+    result = Momentum.backtest(shared[1], lookback, hold, stock_count, start,
+        min_return, cost, fill=False)
+    return dict(lookback=lookback, hold=hold, stock_count=stock_count,
+        **metrics(result))
+
+def sweep(index, lookbacks, holds, stock_counts, start=None, min_return=0.0,
+        cost=0.0, max_workers=None):
+    """lookback x hold x stock_count 의 모든 조합을 프로세스 풀에서 백테스트
+        - index        : (거래일 x 종목) 누적 수익 지수 배열 (Momentum.load_index)
+        - lookbacks    : 모멘텀 과거 거래일 수 리스트 ([60, 120, 250])
+        - holds        : 보유 거래일 수 리스트 ([5, 20, 60])
+        - stock_counts : 종목수 리스트 ([10, 20, 30])
+        - start        : 첫 리밸런싱 행 번호 (None 이면 max(lookbacks), 모든
+                         조합이 같은 날부터 시작해야 비교할 수 있음)
+        - max_workers  : 워커 프로세스 수 (None 이면 CPU 수)
+        배열은 공유 메모리에 한 번만 올리고 워커들은 복사 없이 함께 읽는다.
+        리턴값: 조합별 성과 데이터프레임 (lookback, hold, stock_count, METRICS 열)
+    """
+    index = Momentum.fill_forward(index)
+    start = max(lookbacks) if start is None else max(start, max(lookbacks))
+    grid = list(itertools.product(lookbacks, holds, stock_counts))
+    shape = index.shape
+    started = time.monotonic()
+
+    memory = shared_memory.SharedMemory(create=True,
+        size=max(index.nbytes, 1))
+    try:
+        array = np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+        array[:] = index
+        del array, index
+        results = []
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=attach,
+                initargs=(memory.name, shape)) as executor:
+            futures = [executor.submit(run, params, start, min_return, cost)
+                for params in grid]
+            for future in as_completed(futures):
+                results.append(future.result())
+    finally:
+        memory.close()
+        memory.unlink()
+
+    elapsed = time.monotonic() - started
+    tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+    print(f"[{tmnow}] Momentum sweep : {len(grid)} combinations in "\
+        f"{elapsed:.1f} sec")
+    df = pd.DataFrame(results, columns=['lookback', 'hold', 'stock_count'] +
+        METRICS)
+    return df.sort_values(['stock_count', 'lookback', 'hold']).reset_index(
+        drop=True)
+
+def heatmap(results, metric='cagr', stock_count=None):
+    """sweep() 결과를 lookback 행 x hold 열의 표로 바꿈 (seaborn.heatmap 등에 바로 사용)
+        - metric      : METRICS 중 하나
+        - stock_count : 종목수 하나만 볼 때 지정 (None 이면 (stock_count, lookback) 행)
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Metric({metric}) doesn't exist.")
+    if stock_count is not None:
+        results = results[results['stock_count'] == stock_count]
+        return results.pivot(index='lookback', columns='hold', values=metric)
+    return results.pivot_table(index=['stock_count', 'lookback'],
+        columns='hold', values=metric)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--start', default='2015-01-01', help='첫 리밸런싱일')
+    parser.add_argument('--end', default=datetime.today().strftime(
+        '%Y-%m-%d'), help='종료일')
+    parser.add_argument('--lookbacks', type=int, nargs='+',
+        default=[20, 60, 120, 250], help='모멘텀 과거 거래일 수')
+    parser.add_argument('--holds', type=int, nargs='+',
+        default=[5, 20, 60, 120], help='보유 거래일 수')
+    parser.add_argument('--counts', type=int, nargs='+',
+        default=[5, 10, 20, 30], help='종목수')
+    parser.add_argument('--cost', type=float, default=0.0,
+        help='회전율 1 당 거래비용 비율')
+    parser.add_argument('--workers', type=int, default=None,
+        help='워커 프로세스 수')
+    parser.add_argument('--metric', default='cagr', choices=METRICS)
+    args = parser.parse_args()
+
+    loaded = Momentum.load_index(Analyzer.MarketDB(), args.start, args.end,
+        max(args.lookbacks))
+    if loaded is None:
+        print(f"{args.start} ~ {args.end} -> returned None")
+    else:
+        days, codes, index, first = loaded
+        results = sweep(index, args.lookbacks, args.holds, args.counts, first,
+            cost=args.cost, max_workers=args.workers)
+        print(heatmap(results, args.metric).round(2))
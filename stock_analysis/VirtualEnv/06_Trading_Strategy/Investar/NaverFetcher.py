@@ -0,0 +1,113 @@
+import time
+import threading
+import requests
+import urllib3
+from datetime import datetime
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        """생성자: 초당 rate 개의 토큰을 채우고 최대 capacity 개까지 모아두는 버킷"""
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity else max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.timestamp = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """토큰 하나를 얻을 때까지 대기 (고정 time.sleep(2) 대체)"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                    self.tokens + (now - self.timestamp) * self.rate)
+                self.timestamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class NaverFetcher:
+    def __init__(self, max_workers=8, requests_per_sec=5, timeout=10,
+            cache=None):
+        """생성자: 모든 종목이 함께 쓰는 keep-alive 세션과 호스트별 속도 제한기 생성
+            - max_workers      : 동시에 내려받는 최대 작업 수
+            - requests_per_sec : 호스트별 초당 최대 요청 수
+            - timeout          : 요청 한 건의 제한 시간(초)
+            - cache            : HttpCache 객체, 지정하면 응답을 디스크에 캐시
+        """
+        # ssl 에러 메시지 숨김
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        self.max_workers = max_workers
+        self.requests_per_sec = requests_per_sec
+        self.timeout = timeout
+        self.cache = cache
+
+        self.session = requests.Session()
+        self.session.verify = False
+        self.session.headers.update({'User-agent': 'Mozilla/5.0'})
+        adapter = HTTPAdapter(pool_connections=max_workers,
+            pool_maxsize=max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        self.buckets = dict()
+        self.lock = threading.Lock()
+        self.pages = 0
+        self.started = None
+
+    def close(self):
+        """공유 세션의 커넥션 풀 해제"""
+        self.session.close()
+
+    def get_bucket(self, host):
+        """호스트별 토큰 버킷을 반환 (없으면 생성)"""
+        with self.lock:
+            if host not in self.buckets:
+                self.buckets[host] = TokenBucket(self.requests_per_sec)
+            return self.buckets[host]
+
+    def request(self, url, headers=None):
+        """속도 제한을 지켜서 url 을 요청하고 응답 객체를 반환"""
+        self.get_bucket(urlparse(url).netloc).acquire()
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+        with self.lock:
+            self.pages += 1
+        return response
+
+    def get(self, url):
+        """url 의 본문 문자열을 반환 (캐시가 있으면 캐시를 먼저 확인)"""
+        if self.cache is not None:
+            return self.cache.get(url, lambda headers: self.request(url, headers))
+        return self.request(url).text
+
+    def map(self, func, items):
+        """items 각각에 func 를 스레드 풀에서 실행하고 완료되는 순서대로
+        (item, 결과, 예외) 를 돌려준다"""
+        if self.started is None:
+            self.started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(func, item): item for item in items}
+            for future in as_completed(futures):
+                item = futures[future]
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+    def report(self):
+        """지금까지 내려받은 페이지 수, 초당 페이지 수, 전체 소요 시간 출력"""
+        elapsed = 0.0
+        if self.started is not None:
+            elapsed = time.monotonic() - self.started
+        pages_per_sec = self.pages / elapsed if elapsed > 0 else 0.0
+        tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+        print(f"[{tmnow}] {self.pages} pages fetched in {elapsed:.1f} sec "\
+            f"({pages_per_sec:.2f} pages/sec, workers={self.max_workers}, "\
+            f"{self.requests_per_sec} req/sec per host)")
+        if self.cache is not None:
+            self.cache.report()
@@ -0,0 +1,79 @@
+import re
+import numpy as np
+import pandas as pd
+from lxml import html as lxml_html
+
+# 네이버 sise_day 페이지의 열 순서: 날짜, 종가, 전일비, 시가, 고가, 저가, 거래량
+COLUMNS = ['date', 'open', 'high', 'low', 'close', 'diff', 'volume']
+NON_DIGIT = re.compile(r'[^0-9]')
+# 전일비 칸에서 하락을 나타내는 표시 (예전 이미지 아이콘과 현재 em/span 클래스)
+DOWN_MARKS = ('ico_down', 'bu_pdn', 'nv01', '하락', '하한가')
+
+def to_int(text):
+    """'1,234' 처럼 숫자 외 문자가 섞인 문자열을 정수로 변환 (빈 값은 0)"""
+    digits = NON_DIGIT.sub('', text)
+    return int(digits) if digits else 0
+
+def is_down(td):
+    """전일비 칸이 하락 표시를 포함하는지 여부"""
+    marks = ' '.join(td.xpath('.//@class | .//@src | .//@alt'))
+    marks += td.text_content()
+    return any(mark in marks for mark in DOWN_MARKS)
+
+def parse_last_page(page_html):
+    """시세 페이지의 '맨뒤' 링크에서 마지막 페이지 번호를 반환 (링크가 없으면 1)"""
+    tree = lxml_html.fromstring(page_html)
+    hrefs = tree.xpath('//td[contains(@class, "pgRR")]/a/@href')
+    if not hrefs:
+        return 1
+    return int(hrefs[0].split('=')[-1])
+
+def parse_page(page_html):
+    """시세 페이지 하나를 열 이름별 NumPy 배열 딕셔너리로 변환
+        - date : datetime64[D]
+        - open, high, low, close, volume : int64
+        - diff : int64 (하락이면 음수)
+    """
+    tree = lxml_html.fromstring(page_html)
+    rows = []
+    for tr in tree.xpath('//table[contains(@class, "type2")]//tr'):
+        tds = tr.findall('td')
+        if len(tds) != 7:
+            continue
+        date = tds[0].text_content().strip()
+        if not date:
+            continue  # 구분선 행
+        rows.append((date, tds))
+
+    count = len(rows)
+    dates = np.empty(count, dtype='datetime64[D]')
+    prices = np.empty((6, count), dtype=np.int64)
+    for i, (date, tds) in enumerate(rows):
+        dates[i] = date.replace('.', '-')
+        close = to_int(tds[1].text_content())
+        diff = to_int(tds[2].text_content())
+        prices[0, i] = to_int(tds[3].text_content())  # open
+        prices[1, i] = to_int(tds[4].text_content())  # high
+        prices[2, i] = to_int(tds[5].text_content())  # low
+        prices[3, i] = close
+        prices[4, i] = -diff if is_down(tds[2]) else diff
+        prices[5, i] = to_int(tds[6].text_content())  # volume
+
+    columns = {'date': dates}
+    for idx, col in enumerate(COLUMNS[1:]):
+        columns[col] = prices[idx]
+    return columns
+
+def concat_pages(pages):
+    """parse_page() 결과 여러 개를 열 단위로 이어 붙임"""
+    if not pages:
+        columns = {'date': np.empty(0, dtype='datetime64[D]')}
+        for col in COLUMNS[1:]:
+            columns[col] = np.empty(0, dtype=np.int64)
+        return columns
+    return {col: np.concatenate([page[col] for page in pages])
+        for col in COLUMNS}
+
+def to_frame(columns):
+    """열 배열 딕셔너리를 read_naver() 와 같은 열 순서의 데이터프레임으로 변환"""
+    return pd.DataFrame({col: columns[col] for col in COLUMNS}, copy=False)
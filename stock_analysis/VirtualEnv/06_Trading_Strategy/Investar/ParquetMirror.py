@@ -0,0 +1,135 @@
+import os
+import json
+import pandas as pd
+from datetime import datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # pip install pyarrow
+
+# daily_price 테이블과 같은 열 구성 (code, year 는 폴더 이름으로 표현되는 파티션 열)
+SCHEMA_FIELDS = [('date', 'date32'), ('open', 'int64'), ('high', 'int64'),
+    ('low', 'int64'), ('close', 'int64'), ('diff', 'int64'),
+    ('volume', 'int64')]
+
+class ParquetMirror:
+    def __init__(self, root='daily_price_parquet'):
+        """생성자: daily_price 를 year=YYYY/code=XXXXXX/ 폴더로 나눈 Parquet 데이터셋
+            - root : 데이터셋 최상위 폴더 (_manifest.json 에 종목별 마지막 반영일 기록)
+        """
+        if pa is None:
+            raise ImportError("ParquetMirror requires pyarrow "\
+                "(pip install pyarrow)")
+        self.root = root
+        self.manifest_path = os.path.join(root, '_manifest.json')
+        self.schema = pa.schema([(name, getattr(pa, typ)())
+            for name, typ in SCHEMA_FIELDS])
+        self.partitioning = ds.partitioning(pa.schema([('year', pa.int16()),
+            ('code', pa.string())]), flavor='hive')
+        os.makedirs(root, exist_ok=True)
+
+    def load_manifest(self):
+        """종목별 마지막 반영일 딕셔너리 {code: 'YYYY-MM-DD'}"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as in_file:
+                return json.load(in_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return dict()
+
+    def save_manifest(self, manifest):
+        """manifest 를 임시 파일에 쓴 뒤 교체"""
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as out_file:
+            json.dump(manifest, out_file)
+        os.replace(tmp_path, self.manifest_path)
+
+    def write_partition(self, code, year, df):
+        """(year, code) 파티션 하나를 df 로 통째로 교체"""
+        folder = os.path.join(self.root, f"year={year}", f"code={code}")
+        os.makedirs(folder, exist_ok=True)
+        table = pa.Table.from_pandas(df[[name for name, _ in SCHEMA_FIELDS]],
+            schema=self.schema, preserve_index=False)
+        tmp_path = os.path.join(folder, 'part-0.parquet.tmp')
+        pq.write_table(table, tmp_path)
+        os.replace(tmp_path, os.path.join(folder, 'part-0.parquet'))
+
+    def sync(self, engine, full=False):
+        """daily_price 에서 마지막 반영일부터 바뀐 종목의 해당 연도 파티션만 다시 씀
+        (DBUpdater 가 마지막 저장일의 시세를 다시 쓰므로 마지막 반영일도 다시 반영)
+            - engine : SQLAlchemy 엔진 (DBUpdater.engine)
+            - full   : True 이면 모든 종목, 모든 연도를 다시 씀
+            리턴값: 다시 쓴 파티션 수
+        """
+        manifest = dict() if full else self.load_manifest()
+        sql = "SELECT code, min(date) AS first_date, max(date) AS last_date "\
+            "FROM daily_price GROUP BY code"
+        latest = pd.read_sql(sql, engine)
+
+        written = 0
+        for code, first_date, last_date in latest.itertuples(index=False):
+            last_date = last_date.strftime('%Y-%m-%d')
+            exported = manifest.get(code)
+            if exported is not None and exported > last_date:
+                continue
+            # 이미 반영한 연도 중 마지막 연도부터 다시 쓴다 (그 연도에 새 행이 붙음)
+            from_year = int(exported[:4]) if exported else first_date.year
+            sql = "SELECT date, open, high, low, close, diff, volume "\
+                "FROM daily_price WHERE code = %(code)s AND date >= %(start)s "\
+                "ORDER BY date"
+            df = pd.read_sql(sql, engine, params={'code': code,
+                'start': f"{from_year:04d}-01-01"})
+            df['date'] = pd.to_datetime(df['date']).dt.date
+            years = pd.to_datetime(df['date']).dt.year
+            for year, part in df.groupby(years.values):
+                self.write_partition(code, int(year), part)
+                written += 1
+            manifest[code] = last_date
+        self.save_manifest(manifest)
+
+        tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+        print(f"[{tmnow}] Parquet mirror ({self.root}) : {written} "\
+            "partitions written")
+        return written
+
+    def dataset(self):
+        """연도/종목 파티션을 인식하는 pyarrow 데이터셋"""
+        return ds.dataset(self.root, format='parquet',
+            partitioning=self.partitioning, exclude_invalid_files=True)
+
+    def read_table(self, codes=None, start_date=None, end_date=None,
+            columns=None):
+        """조건에 맞는 행만 Arrow 테이블로 반환 (파티션 가지치기 + 조건 푸시다운)
+            - codes      : 종목코드 리스트 (None 이면 전체)
+            - start_date : 조회 시작일('2020-01-01')
+            - end_date   : 조회 종료일('2020-12-31')
+            - columns    : 읽을 열 리스트 (None 이면 전체, code 와 date 는 항상 포함)
+        """
+        conditions = []
+        if codes is not None:
+            conditions.append(ds.field('code').isin(list(codes)))
+        if start_date is not None:
+            start = datetime.strptime(start_date, '%Y-%m-%d').date()
+            conditions.append(ds.field('year') >= start.year)
+            conditions.append(ds.field('date') >= pa.scalar(start, pa.date32()))
+        if end_date is not None:
+            end = datetime.strptime(end_date, '%Y-%m-%d').date()
+            conditions.append(ds.field('year') <= end.year)
+            conditions.append(ds.field('date') <= pa.scalar(end, pa.date32()))
+        expr = None
+        for cond in conditions:
+            expr = cond if expr is None else expr & cond
+
+        if columns is not None:
+            columns = ['code', 'date'] + [col for col in columns
+                if col not in ('code', 'date')]
+        return self.dataset().to_table(columns=columns, filter=expr)
+
+    def read_frame(self, codes=None, start_date=None, end_date=None,
+            columns=None):
+        """read_table() 결과를 복사를 최소화해서 데이터프레임으로 변환"""
+        table = self.read_table(codes, start_date, end_date, columns)
+        return table.to_pandas(split_blocks=True, self_destruct=True,
+            date_as_object=False)
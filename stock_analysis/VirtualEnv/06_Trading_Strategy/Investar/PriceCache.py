@@ -0,0 +1,96 @@
+import pandas as pd
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+class PriceCache:
+    def __init__(self, max_rows=2000000):
+        """생성자: 종목별로 지금까지 읽은 가장 넓은 기간의 시세를 보관하는 LRU 캐시
+            - max_rows : 전체 캐시가 보관할 최대 행 수 (넘으면 오래 안 쓴 종목부터 제거)
+        """
+        self.max_rows = max_rows
+        self.entries = OrderedDict()  # code -> [start, end, df]
+        self.rows = 0
+        self.version = None
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self, version=None):
+        """모든 항목 삭제 (DB 데이터 버전이 바뀌었을 때)"""
+        self.entries.clear()
+        self.rows = 0
+        self.version = version
+
+    def get(self, code, start_date, end_date, loader):
+        """code 의 start_date ~ end_date 시세를 반환 (항상 사본)
+            - loader : loader(code, start, end) 가 해당 기간 데이터프레임을 반환
+            캐시된 기간이 요청을 포함하면 잘라서 돌려주고, 일부만 겹치면
+            모자란 앞/뒤 구간만 loader 로 읽어서 기존 항목에 이어 붙인다
+        """
+        start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        entry = self.entries.get(code)
+        if entry is None:
+            self.misses += 1
+            df = loader(code, start_date, end_date)
+            self.put(code, start, end, df)
+            return df.copy()
+
+        cached_start, cached_end, df = entry
+        self.entries.move_to_end(code)
+        if cached_start <= start and end <= cached_end:
+            self.hits += 1
+        else:
+            self.partial_hits += 1
+            parts = []
+            if start < cached_start:
+                parts.append(loader(code, start_date, (cached_start -
+                    timedelta(days=1)).strftime('%Y-%m-%d')))
+            parts.append(df)
+            if end > cached_end:
+                parts.append(loader(code, (cached_end +
+                    timedelta(days=1)).strftime('%Y-%m-%d'), end_date))
+            df = pd.concat(parts)
+            self.put(code, min(start, cached_start), max(end, cached_end), df)
+
+        dates = df['date']
+        return df[(dates >= pd.Timestamp(start)) &
+            (dates <= pd.Timestamp(end))].copy()
+
+    def missing(self, code, start_date, end_date):
+        """get() 이 loader 로 읽게 될 (시작일, 종료일) 구간 리스트
+        (AsyncMarketDB 가 미리 비동기로 읽어 둘 구간을 정할 때 사용)"""
+        start = datetime.strptime(start_date, '%Y-%m-%d').date()
+        end = datetime.strptime(end_date, '%Y-%m-%d').date()
+        entry = self.entries.get(code)
+        if entry is None:
+            return [(start_date, end_date)]
+        cached_start, cached_end, _ = entry
+        ranges = []
+        if start < cached_start:
+            ranges.append((start_date, (cached_start -
+                timedelta(days=1)).strftime('%Y-%m-%d')))
+        if end > cached_end:
+            ranges.append(((cached_end + timedelta(days=1)).strftime(
+                '%Y-%m-%d'), end_date))
+        return ranges
+
+    def put(self, code, start, end, df):
+        """항목을 저장하고 max_rows 를 넘으면 LRU 순서로 제거"""
+        old = self.entries.pop(code, None)
+        if old is not None:
+            self.rows -= len(old[2])
+        self.entries[code] = [start, end, df]
+        self.rows += len(df)
+        while self.rows > self.max_rows and len(self.entries) > 1:
+            _, (_, _, evicted) = self.entries.popitem(last=False)
+            self.rows -= len(evicted)
+            self.evictions += 1
+
+    def info(self):
+        """캐시 적중/부분 적중/미적중/제거 횟수와 현재 크기를 딕셔너리로 반환"""
+        return {'hits': self.hits, 'partial_hits': self.partial_hits,
+            'misses': self.misses, 'evictions': self.evictions,
+            'codes': len(self.entries), 'rows': self.rows,
+            'max_rows': self.max_rows, 'version': self.version}
@@ -0,0 +1,243 @@
+import os
+import json
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+try:
+    from Investar import FastQuery
+except ImportError:
+    import FastQuery
+
+CODE_STEP = 256  # 종목 행을 미리 확보하는 단위
+DAY_STEP = 512   # 거래일 열을 미리 확보하는 단위 (약 2년)
+
+class PriceStore:
+    def __init__(self, root='price_store', fields=None):
+        """생성자: 필드별 (종목 x 거래일) float64 배열을 파일로 두는 memmap 시세 저장소
+            - root   : 저장 폴더 (header.json, days.npy, <field>.bin)
+            - fields : 저장할 daily_price 열 (None 이면 전체)
+            배열은 종목 행마다 거래일이 연속으로 놓이고(C 순서), 시세가 없는
+            칸은 NaN 이다. 종목/거래일 칸을 CODE_STEP/DAY_STEP 단위로 미리
+            잡아 두므로 평소 갱신은 파일 크기를 바꾸지 않고 제자리에 쓴다.
+        """
+        self.root = root
+        self.fields = list(fields or FastQuery.PRICE_FIELDS)
+        self.header = None
+        self.days = None
+        self.index = dict()  # 종목코드 -> 행 번호
+        self.arrays = dict()
+
+    def path(self, name):
+        """저장 폴더 안의 파일 경로"""
+        return os.path.join(self.root, name)
+
+    def load_header(self):
+        """header.json 과 days.npy 를 읽음 (없으면 None)"""
+        try:
+            header_path = self.path('header.json')
+            with open(header_path, 'r', encoding='utf-8') as in_file:
+                header = json.load(in_file)
+            days = np.load(self.path('days.npy'))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        self.header = header
+        self.days = days[:header['days']]
+        self.index = {code: idx for idx, code in enumerate(header['codes'])}
+        self.arrays = dict()
+        return header
+
+    def save_header(self):
+        """days.npy 와 header.json 을 임시 파일에 쓴 뒤 교체 (header 가 마지막)"""
+        self.header['updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        with open(self.path('days.npy.tmp'), 'wb') as out_file:
+            np.save(out_file, self.days)
+        os.replace(self.path('days.npy.tmp'), self.path('days.npy'))
+        tmp_path = self.path('header.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as out_file:
+            json.dump(self.header, out_file)
+        os.replace(tmp_path, self.path('header.json'))
+
+    def open(self):
+        """읽기 전용으로 열기 (배열은 field() 에서 필요할 때 memmap)"""
+        if self.load_header() is None:
+            raise FileNotFoundError(f"Price store ({self.root}) doesn't "\
+                "exist. Run DBUpdater with \"price_store\" in config.json.")
+        self.fields = self.header['fields']
+        return self
+
+    def is_stale(self):
+        """열어 둔 뒤에 DBUpdater 가 저장소를 갱신했으면 True"""
+        try:
+            header_path = self.path('header.json')
+            with open(header_path, 'r', encoding='utf-8') as in_file:
+                header = json.load(in_file)
+            return header.get('updated') != self.header.get('updated')
+        except (FileNotFoundError, json.JSONDecodeError):
+            return False
+
+    def memmap(self, field, mode='r'):
+        """field 파일 전체 (code_capacity x day_capacity) memmap"""
+        return np.memmap(self.path(f"{field}.bin"), dtype=np.float64,
+            mode=mode, shape=(self.header['code_capacity'],
+            self.header['day_capacity']))
+
+    def field(self, field):
+        """field 의 (종목 x 거래일) 읽기 전용 배열 (실제로 쓰인 부분만)"""
+        if field not in self.arrays:
+            if field not in self.fields:
+                raise ValueError(f"Field({field}) doesn't exist.")
+            self.arrays[field] = self.memmap(field)[:len(self.index),
+                :len(self.days)]
+        return self.arrays[field]
+
+    def allocate(self, codes, days, old=None):
+        """code_capacity x day_capacity 크기의 NaN 파일을 새로 만들고
+        old 저장소(헤더)가 있으면 기존 값을 복사 (칸이 모자랄 때만 호출)"""
+        code_capacity = (len(codes) // CODE_STEP + 1) * CODE_STEP
+        day_capacity = (len(days) // DAY_STEP + 1) * DAY_STEP
+        for field in self.fields:
+            tmp_path = self.path(f"{field}.bin.tmp")
+            target = np.memmap(tmp_path, dtype=np.float64, mode='w+',
+                shape=(code_capacity, day_capacity))
+            for start in range(0, code_capacity, CODE_STEP):
+                target[start:start + CODE_STEP] = np.nan
+            if old is not None:
+                source = np.memmap(self.path(f"{field}.bin"),
+                    dtype=np.float64, mode='r', shape=(old['code_capacity'],
+                    old['day_capacity']))
+                target[:len(old['codes']), :old['days']] = \
+                    source[:len(old['codes']), :old['days']]
+                del source
+            target.flush()
+            del target
+            os.replace(tmp_path, self.path(f"{field}.bin"))
+        return code_capacity, day_capacity
+
+    def sync(self, conn, days, full=False, chunk_codes=200):
+        """daily_price 의 마지막 저장 거래일 이후와 새 종목만 저장소에 반영
+            - conn        : pymysql 연결
+            - days        : 전체 거래일 datetime64[D] 배열 (TradingCalendar.days)
+            - full        : True 이면 저장소를 처음부터 다시 만듦
+            - chunk_codes : 한 번에 읽는 종목 수 (메모리 사용량 제한)
+            저장된 거래일이 days 의 앞부분과 다르면(과거 구간 재적재) 다시 만든다.
+            리턴값: 반영한 행 수
+        """
+        os.makedirs(self.root, exist_ok=True)
+        old = None if full else self.load_header()
+        if old is not None and not np.array_equal(self.days,
+                days[:len(self.days)]):
+            old = None
+        with conn.cursor() as curs:
+            curs.execute("SELECT DISTINCT code FROM daily_price ORDER BY code")
+            all_codes = [row[0] for row in curs.fetchall()]
+        conn.commit()
+
+        if old is None:
+            codes = all_codes
+            load = [(codes, None)]
+            self.header = {'fields': self.fields, 'codes': codes}
+            self.header['code_capacity'], self.header['day_capacity'] = \
+                self.allocate(codes, days)
+        else:
+            self.fields = old['fields']
+            new_codes = [code for code in all_codes if code not in self.index]
+            codes = old['codes'] + new_codes
+            # 기존 종목은 저장된 마지막 거래일부터 (DBUpdater 가 그날 시세를
+            # 다시 쓰므로), 새 종목은 전체
+            since = None
+            if len(self.days) > 0:
+                since = str(self.days[-1])
+            load = [(old['codes'], since), (new_codes, None)]
+            self.header = dict(old, codes=codes)
+            if len(codes) > old['code_capacity'] or \
+                    len(days) > old['day_capacity']:
+                self.header['code_capacity'], self.header['day_capacity'] = \
+                    self.allocate(codes, days, old)
+        self.days = days
+        self.header['days'] = len(days)
+        self.index = {code: idx for idx, code in enumerate(codes)}
+
+        written = 0
+        arrays = {field: self.memmap(field, 'r+') for field in self.fields}
+        for load_codes, since in load:
+            if since is not None and since > str(days[-1]):
+                continue  # 새 거래일 없음
+            for start in range(0, len(load_codes), chunk_codes):
+                chunk = load_codes[start:start + chunk_codes]
+                df = FastQuery.read_prices(conn, chunk, since or '1900-01-01',
+                    '9999-12-31', self.fields)
+                rows = df['code'].map(self.index).values.astype(np.int64)
+                cols = np.searchsorted(days,
+                    df['date'].values.astype('datetime64[D]'))
+                for field in self.fields:
+                    arrays[field][rows, cols] = df[field].values
+                written += len(df)
+        for array in arrays.values():
+            array.flush()
+        del arrays
+        self.arrays = dict()
+        self.save_header()
+
+        tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+        print(f"[{tmnow}] Price store ({self.root}) : {written} rows written "\
+            f"({len(codes)} codes x {len(days)} days)")
+        return written
+
+    def window(self, start_date=None, end_date=None):
+        """start_date ~ end_date 거래일의 열 범위 slice"""
+        lo = 0 if start_date is None else np.searchsorted(self.days,
+            np.datetime64(start_date, 'D'), side='left')
+        hi = len(self.days) if end_date is None else np.searchsorted(
+            self.days, np.datetime64(end_date, 'D'), side='right')
+        return slice(lo, hi)
+
+    def array(self, field, codes=None, start_date=None, end_date=None):
+        """field 의 (종목 x 거래일) 배열을 잘라서 반환
+            - codes : 종목코드 리스트 (None 이면 전체, 이때는 복사 없는 memmap 뷰)
+            저장소에 없는 종목은 NaN 행
+        """
+        cols = self.window(start_date, end_date)
+        data = self.field(field)
+        if codes is None:
+            return data[:, cols]
+        rows = np.array([self.index.get(code, -1) for code in codes],
+            dtype=np.int64)
+        result = data[np.maximum(rows, 0), cols]
+        result[rows < 0] = np.nan
+        return result
+
+    def at(self, field, dates, codes=None):
+        """dates 거래일들의 field 값을 (종목 x 날짜) 배열로 반환
+            - dates : 조회일 리스트 (저장소에 없는 날짜는 NaN 열)
+            - codes : 종목코드 리스트 (None 이면 저장소의 전체 종목 순서)
+            기간을 잘라 읽지 않고 필요한 날짜 열만 읽는다.
+        """
+        days = np.array(dates, dtype='datetime64[D]')
+        n_codes = len(self.index) if codes is None else len(codes)
+        if len(self.days) == 0:
+            return np.full((n_codes, len(days)), np.nan)
+        cols = np.minimum(np.searchsorted(self.days, days), len(self.days) - 1)
+        found = self.days[cols] == days
+        data = self.field(field)
+        if codes is None:
+            result = data[:, cols]
+        else:
+            rows = np.array([self.index.get(code, -1) for code in codes],
+                dtype=np.int64)
+            result = data[np.maximum(rows, 0)[:, None], cols]
+            result[rows < 0] = np.nan
+        result[:, ~found] = np.nan
+        return result
+
+    def frame(self, field='close', codes=None, start_date=None,
+            end_date=None):
+        """field 를 날짜 인덱스, 종목코드 열의 데이터프레임으로 반환
+        (get_daily_prices() 의 wide 형태와 같은 모양)"""
+        cols = self.window(start_date, end_date)
+        data = self.array(field, codes, start_date, end_date)
+        if codes is None:
+            codes = self.header['codes']
+        return pd.DataFrame(data.T, index=pd.DatetimeIndex(
+            self.days[cols].astype('datetime64[ns]'), name='date'),
+            columns=list(codes), copy=False)
@@ -0,0 +1,143 @@
+import numpy as np
+from datetime import datetime
+
+def compute_returns(close, diff, prev_close=None, prev_index=1.0):
+    """종가와 전일비 배열로 수정종가 배수, 수익률, 누적 수익 지수를 계산
+        - close      : 날짜순 종가 int64 배열
+        - diff       : 전일비 배열 (네이버 전일비는 액면분할 등을 반영한 기준가 대비)
+        - prev_close : close[0] 직전 거래일 종가 (None 이면 close[0] 이 첫 행)
+        - prev_index : prev_close 날의 누적 수익 지수
+        리턴값: (adj_ratio, ret, log_ret, cum_index, actions)
+            adj_ratio : 마지막 날 기준 수정종가 배수 (adj_close = close * adj_ratio)
+            actions   : 기준가가 전일 종가와 다른 날(분할/병합/증자 등) 수
+        전일 종가 + 전일비 가 종가와 맞지 않으면 기준가(close - diff)가 조정된
+        날로 보고, 그날 수익률은 기준가 대비로 계산하고 이전 날짜들의
+        수정종가에는 기준가 / 전일 종가 비율을 곱한다. 예전 방식으로 적재한
+        daily_price 는 전일비 부호가 없으므로 close + diff 가 전일 종가와
+        같은 날도 조정 없는 날로 본다.
+    """
+    close = np.asarray(close, dtype=np.float64)
+    diff = np.asarray(diff, dtype=np.float64)
+    prev = np.empty_like(close)
+    prev[1:] = close[:-1]
+    prev[:1] = np.nan if prev_close is None else prev_close
+    base = close - diff
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        action = (prev != base) & (prev != close + diff) & (base > 0) & \
+            ~np.isnan(prev)
+        ret = np.where(action, close / base, close / prev) - 1
+        ret[~np.isfinite(ret)] = np.nan
+        log_ret = np.log1p(ret)
+        factor = np.where(action, base / prev, 1.0)
+
+    # 날짜 t 의 배수는 t 이후 모든 조정 비율의 곱 (마지막 날은 1)
+    adj_ratio = np.ones_like(close)
+    adj_ratio[:-1] = np.cumprod(factor[::-1])[::-1][1:]
+    cum_index = prev_index * np.cumprod(np.where(np.isnan(ret), 0.0, ret) + 1)
+    return adj_ratio, ret, log_ret, cum_index, int(action.sum())
+
+
+class ReturnTable:
+    def __init__(self, conn, batch_size=1000):
+        """생성자: daily_price 에서 계산한 수정종가와 수익률을 담는 daily_return 테이블 생성
+            - adj_close : 마지막 거래일 종가 기준으로 과거를 조정한 수정종가
+            - ret       : 일간 단순 수익률 (종목의 첫 행은 NULL)
+            - log_ret   : 일간 로그 수익률
+            - cum_index : 종목 첫 날을 1 로 하는 누적 수익 지수
+        """
+        self.conn = conn
+        self.batch_size = batch_size
+        with self.conn.cursor() as curs:
+            sql = """
+            CREATE TABLE IF NOT EXISTS daily_return (
+                code VARCHAR(20),
+                date DATE,
+                adj_close DOUBLE,
+                ret DOUBLE,
+                log_ret DOUBLE,
+                cum_index DOUBLE,
+                PRIMARY KEY (code, date))
+            """
+            curs.execute(sql)
+        self.conn.commit()
+
+    def get_states(self):
+        """종목별 daily_return 마지막 바로 앞 행 {code: (date, cum_index)}
+        (DBUpdater 가 마지막 저장일의 시세를 다시 쓰므로 마지막 행은 다시 계산)"""
+        with self.conn.cursor() as curs:
+            sql = "SELECT r.code, r.date, r.cum_index FROM daily_return r "\
+                "JOIN (SELECT d.code, max(d.date) AS date FROM daily_return d "\
+                "JOIN (SELECT code, max(date) AS last FROM daily_return "\
+                "GROUP BY code) m ON d.code = m.code AND d.date < m.last "\
+                "GROUP BY d.code) p ON r.code = p.code AND r.date = p.date"
+            curs.execute(sql)
+            return {code: (date, cum_index) for code, date, cum_index
+                in curs.fetchall()}
+
+    def read_prices(self, code, start_date=None):
+        """code 의 start_date(포함) 이후 (date, close, diff) 행 리스트"""
+        with self.conn.cursor() as curs:
+            sql = "SELECT date, close, diff FROM daily_price "\
+                "WHERE code = %s AND date >= %s ORDER BY date"
+            curs.execute(sql, (code, start_date or '1900-01-01'))
+            return curs.fetchall()
+
+    def update(self, codes=None, full=False):
+        """daily_price 에 새로 들어온 날짜와 마지막으로 반영한 날짜를 daily_return 에 반영
+            - codes : 갱신할 종목코드 리스트 (None 이면 daily_price 의 전체 종목)
+            - full  : True 이면 종목별로 처음부터 다시 계산
+            새 날짜에 분할 등 기준가 조정이 있으면 그 종목의 수정종가 전체가
+            바뀌므로 종목 전체를 다시 계산한다.
+            리턴값: 쓴 행 수
+        """
+        if codes is None:
+            with self.conn.cursor() as curs:
+                curs.execute("SELECT DISTINCT code FROM daily_price")
+                codes = [row[0] for row in curs.fetchall()]
+        states = dict() if full else self.get_states()
+
+        written = 0
+        rebuilt = 0
+        for code in codes:
+            state = states.get(code)
+            rows = self.read_prices(code, state[0] if state else None)
+            if state is not None:
+                if len(rows) <= 1:
+                    continue  # 마지막 바로 앞 날짜 이후 행 없음
+                prev_close = rows[0][1]
+                rows = rows[1:]
+                result = compute_returns([row[1] for row in rows],
+                    [row[2] for row in rows], prev_close, state[1])
+                if result[4] > 0:
+                    # 조정이 생겼으면 과거 수정종가까지 다시 계산
+                    rows = self.read_prices(code)
+                    state = None
+                    rebuilt += 1
+            if state is None:
+                if not rows:
+                    continue
+                result = compute_returns([row[1] for row in rows],
+                    [row[2] for row in rows])
+            written += self.write(code, rows, result)
+
+        tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+        print(f"[{tmnow}] daily_return : {written} rows written "\
+            f"({rebuilt} codes rebuilt after price adjustments)")
+        return written
+
+    def write(self, code, rows, result):
+        """계산 결과를 batch_size 행씩 REPLACE INTO daily_return"""
+        adj_ratio, ret, log_ret, cum_index, _ = result
+        values = []
+        for idx, (date, close, _) in enumerate(rows):
+            values.append((code, date, float(close * adj_ratio[idx]),
+                None if np.isnan(ret[idx]) else float(ret[idx]),
+                None if np.isnan(log_ret[idx]) else float(log_ret[idx]),
+                float(cum_index[idx])))
+        with self.conn.cursor() as curs:
+            sql = "REPLACE INTO daily_return VALUES (%s, %s, %s, %s, %s, %s)"
+            for start in range(0, len(values), self.batch_size):
+                curs.executemany(sql, values[start:start + self.batch_size])
+                self.conn.commit()
+        return len(values)
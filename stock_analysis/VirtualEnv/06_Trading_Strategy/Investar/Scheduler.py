@@ -0,0 +1,109 @@
+import os
+import csv
+import json
+import time
+import threading
+from datetime import datetime, timedelta
+
+def load_holidays(path):
+    """휴장일 파일(JSON 날짜 문자열 리스트)을 읽어서 date 집합으로 반환"""
+    try:
+        with open(path, 'r', encoding='utf-8') as in_file:
+            days = json.load(in_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        print(f"Holiday file ({path}) is missing or broken, "\
+            "only weekends are skipped.")
+        return set()
+    return {datetime.strptime(day, '%Y-%m-%d').date() for day in days}
+
+class DailyScheduler:
+    def __init__(self, job, hour=17, minute=0, holiday_file=None,
+            metrics_file='update_runs.csv'):
+        """생성자: KRX 거래일마다 hour:minute 에 job 을 실행하는 스케줄러
+            - job          : 인자 없이 호출할 함수
+            - holiday_file : KRX 휴장일 JSON 파일 (기본값은 같은 폴더의
+                             krx_holidays.json)
+            - metrics_file : 실행 시각과 소요 시간을 남길 CSV 파일
+        """
+        if holiday_file is None:
+            holiday_file = os.path.join(os.path.dirname(
+                os.path.abspath(__file__)), 'krx_holidays.json')
+        self.job = job
+        self.hour = hour
+        self.minute = minute
+        self.holidays = load_holidays(holiday_file)
+        self.metrics_file = metrics_file
+        self.lock = threading.Lock()
+
+    def is_trading_day(self, day):
+        """주말과 휴장일이 아니면 True"""
+        return day.weekday() < 5 and day not in self.holidays
+
+    def next_run_time(self, now):
+        """now 이후 첫 거래일의 실행 시각을 반환"""
+        tmnext = now.replace(hour=self.hour, minute=self.minute, second=0,
+            microsecond=0)
+        if tmnext <= now:
+            tmnext += timedelta(days=1)
+        while not self.is_trading_day(tmnext.date()):
+            tmnext += timedelta(days=1)
+        return tmnext
+
+    def run_once(self, job=None):
+        """job(기본값은 self.job) 을 한 번 실행하고 소요 시간을 기록
+        (이전 실행이 끝나지 않았으면 건너뜀)"""
+        if not self.lock.acquire(blocking=False):
+            print("Previous update is still running, skipped.")
+            return None
+        started = datetime.now()
+        status = 'ok'
+        try:
+            (job or self.job)()
+        except Exception as e:
+            status = f'error: {e}'
+            print(f"Update failed : {e}")
+        finally:
+            self.lock.release()
+        finished = datetime.now()
+        elapsed = (finished - started).total_seconds()
+        print(f"[{finished.strftime('%Y-%m-%d %H:%M')}] Update finished in "\
+            f"{elapsed:.1f} sec ({status})")
+        self.write_metrics(started, finished, elapsed, status)
+        return elapsed
+
+    def write_metrics(self, started, finished, elapsed, status):
+        """실행 기록을 metrics_file 에 한 줄 추가"""
+        if not self.metrics_file:
+            return
+        new_file = not os.path.exists(self.metrics_file)
+        with open(self.metrics_file, 'a', newline='', encoding='utf-8') as out:
+            writer = csv.writer(out)
+            if new_file:
+                writer.writerow(['started', 'finished', 'seconds', 'status'])
+            writer.writerow([started.strftime('%Y-%m-%d %H:%M:%S'),
+                finished.strftime('%Y-%m-%d %H:%M:%S'), f"{elapsed:.1f}",
+                status])
+
+    def run_forever(self, run_now=True):
+        """run_now 이면 오늘이 거래일이고 이미 hour:minute 이 지났을 때 즉시 한 번
+        실행하고, 이후 거래일마다 실행. 장 마감 전에는 장중 시세를 저장하지 않도록
+        즉시 실행하지 않고 오늘 실행 시각까지 기다림.
+        다음 실행 시각은 이전 실행이 끝난 뒤에 계산하므로 실행이 겹치지 않음"""
+        if run_now:
+            now = datetime.now()
+            if not self.is_trading_day(now.date()):
+                print("Today is not a trading day, skipped.")
+            elif now < now.replace(hour=self.hour, minute=self.minute,
+                    second=0, microsecond=0):
+                print("Market data is not final yet, waiting for today's run.")
+            else:
+                self.run_once()
+        while True:
+            tmnext = self.next_run_time(datetime.now())
+            print(f"Waiting for next update ({tmnext.strftime('%Y-%m-%d %H:%M')}) ...")
+            while True:
+                secs = (tmnext - datetime.now()).total_seconds()
+                if secs <= 0:
+                    break
+                time.sleep(min(secs, 60))  # 시스템 절전/시간 변경에 대비해 나눠서 대기
+            self.run_once()
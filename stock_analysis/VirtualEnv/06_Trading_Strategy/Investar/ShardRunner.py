@@ -0,0 +1,110 @@
+import zlib
+import time
+import argparse
+import traceback
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from Investar import DBUpdater, ParquetMirror
+except ImportError:
+    import DBUpdater, ParquetMirror
+
+def shard_of(code, shards):
+    """종목코드가 속한 샤드 번호 (프로세스가 달라도 같은 값이 나오도록 crc32 사용)"""
+    return zlib.crc32(code.encode('utf-8')) % shards
+
+def run_shard(shard, shards, full=False):
+    """샤드 하나를 처리: 자체 DB 연결과 세션으로 shard 번 종목만 업데이트
+        - shard  : 처리할 샤드 번호 (0 ~ shards-1)
+        - shards : 전체 샤드 수
+        - full   : True 이면 저장된 날짜와 관계없이 전체를 다시 읽음
+        리턴값: 샤드 번호, 처리 종목 수, 실패 종목, 페이지 수, 소요 시간, 오류 딕셔너리
+    """
+    result = {'shard': shard, 'codes': 0, 'failed': [], 'pages': 0,
+        'elapsed': 0.0, 'error': None}
+    dbu = None
+    try:
+        dbu = DBUpdater.DBUpdater()
+        dbu.read_comp_info()
+        dbu.codes = {code: company for code, company in dbu.codes.items()
+            if shard_of(code, shards) == shard}
+        pages_to_fetch, max_workers, _ = dbu.read_config()
+
+        # 네이버 호스트 전체 요청 속도가 total_requests_per_sec 을 넘지 않도록 나눠 가짐
+        summary = dbu.update_daily_price(pages_to_fetch, max_workers,
+            dbu.total_requests_per_sec / shards, full)
+        dbu.update_returns(list(dbu.codes), full)
+        result.update(summary)
+    except Exception:
+        result['error'] = traceback.format_exc()
+    finally:
+        if dbu is not None:
+            dbu.close()
+    return result
+
+def run_all(shards, full=False):
+    """KRX 목록을 한 번 갱신한 뒤 shards 개 프로세스로 나눠서 업데이트하고
+    샤드별 결과를 합쳐서 출력"""
+    started = time.monotonic()
+    dbu = DBUpdater.DBUpdater()
+    _, _, requests_per_sec = dbu.read_config()
+    if shards > 1 and dbu.total_requests_per_sec <= requests_per_sec:
+        # 샤드는 호스트 요청 한도를 나눠 가질 뿐이므로 한도를 올려야 빨라짐
+        print(f"Note : total_requests_per_sec is "\
+            f"{dbu.total_requests_per_sec}/sec, the single-process rate. "\
+            f"Sharding only helps when it is raised in config.json.")
+    dbu.update_comp_info()
+    dbu.close()
+
+    results = []
+    with ProcessPoolExecutor(max_workers=shards) as executor:
+        futures = [executor.submit(run_shard, shard, shards, full)
+            for shard in range(shards)]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+            print(f"[{tmnow}] shard {result['shard']}/{shards} : "\
+                f"{result['codes']} codes, {len(result['failed'])} failed, "\
+                f"{result['pages']} pages, {result['elapsed']:.1f} sec")
+
+    # 거래일 달력은 전체 종목 기준이므로 샤드가 모두 끝난 뒤 한 번만 갱신
+    dbu.update_calendar(full)
+    if dbu.price_store_dir:
+        dbu.update_price_store(full)
+    # 분석용 Parquet 미러도 update_all 과 같이 샤드가 모두 끝난 뒤 반영
+    if dbu.parquet_dir:
+        ParquetMirror.ParquetMirror(dbu.parquet_dir).sync(dbu.engine, full)
+    dbu.close()
+
+    elapsed = time.monotonic() - started
+    pages = sum(r['pages'] for r in results)
+    failed = sorted(code for r in results for code in r['failed'])
+    print(f"\nTotal : {sum(r['codes'] for r in results)} codes, "\
+        f"{pages} pages in {elapsed:.1f} sec ({pages / elapsed:.2f} pages/sec)")
+    if failed:
+        print(f"Failed codes ({len(failed)}) : {', '.join(failed)}")
+    for r in sorted(results, key=lambda r: r['shard']):
+        if r['error']:
+            print(f"\nshard {r['shard']} error:\n{r['error']}")
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--shards', type=int, default=4,
+        help='워커 프로세스(샤드) 수 (config.json 의 total_requests_per_sec '\
+            '을 샤드들이 나눠 가짐)')
+    parser.add_argument('--shard', type=int, default=None,
+        help='지정하면 해당 샤드 하나만 현재 프로세스에서 다시 실행')
+    parser.add_argument('--full', action='store_true',
+        help='저장된 날짜와 관계없이 pages_to_fetch 만큼 전체를 다시 읽음')
+    args = parser.parse_args()
+
+    if args.shard is None:
+        run_all(args.shards, args.full)
+    else:
+        result = run_shard(args.shard, args.shards, args.full)
+        print(result['error'] or f"shard {args.shard}/{args.shards} : "\
+            f"{result['codes']} codes, {len(result['failed'])} failed, "\
+            f"{result['pages']} pages, {result['elapsed']:.1f} sec")
@@ -0,0 +1,93 @@
+import os
+import numpy as np
+from datetime import datetime
+
+class TradingCalendar:
+    def __init__(self, path=None):
+        """생성자: daily_price 에 있는 거래일을 정렬된 datetime64[D] 배열로 보관
+            - path : 배열을 저장하는 파일 (있으면 읽어오고, DBUpdater 가 갱신,
+                     기본값은 같은 폴더의 trading_days.npy 이므로 실행 위치와
+                     관계없이 DBUpdater 와 MarketDB 가 같은 파일을 씀)
+        """
+        if path is None:
+            path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                'trading_days.npy')
+        self.path = path
+        self.days = np.array([], dtype='datetime64[D]')
+        if path and os.path.exists(path):
+            self.days = np.load(path)
+
+    def save(self):
+        """배열을 임시 파일에 쓴 뒤 교체"""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'wb') as out_file:
+            np.save(out_file, self.days)
+        os.replace(tmp_path, self.path)
+
+    def refresh(self, conn, full=False):
+        """daily_price 에서 마지막 거래일 이후의 날짜만 읽어서 추가
+            - conn : pymysql 연결
+            - full : True 이면 전체 날짜를 다시 읽음 (과거 구간을 다시 적재한 뒤)
+            (date, code) 인덱스만 훑으므로 테이블 전체를 읽지 않는다
+            리턴값: 추가한 거래일 수
+        """
+        last = None if full or len(self.days) == 0 else str(self.days[-1])
+        with conn.cursor() as curs:
+            sql = "SELECT DISTINCT date FROM daily_price WHERE date > %s "\
+                "ORDER BY date"
+            curs.execute(sql, (last or '1900-01-01'))
+            new_days = np.array([row[0] for row in curs.fetchall()],
+                dtype='datetime64[D]')
+        conn.commit()
+        if full:
+            self.days = new_days
+        elif len(new_days) > 0:
+            self.days = np.concatenate([self.days, new_days])
+        return len(new_days)
+
+    def to_day(self, date):
+        """'2024-01-02', date, datetime, Timestamp 를 datetime64[D] 로 변환"""
+        if isinstance(date, str):
+            return np.datetime64(date[:10], 'D')
+        return np.datetime64(date, 'D')
+
+    def is_trading_day(self, date):
+        """date 가 거래일이면 True"""
+        day = self.to_day(date)
+        idx = np.searchsorted(self.days, day)
+        return idx < len(self.days) and self.days[idx] == day
+
+    def prev_day(self, date):
+        """date 또는 그 이전의 마지막 거래일 ('YYYY-MM-DD', 없으면 None)"""
+        idx = np.searchsorted(self.days, self.to_day(date), side='right') - 1
+        return str(self.days[idx]) if idx >= 0 else None
+
+    def next_day(self, date):
+        """date 또는 그 이후의 첫 거래일 ('YYYY-MM-DD', 없으면 None)"""
+        idx = np.searchsorted(self.days, self.to_day(date), side='left')
+        return str(self.days[idx]) if idx < len(self.days) else None
+
+    def offset(self, date, n):
+        """date 로부터 n 거래일 뒤(음수면 앞)의 날짜 ('YYYY-MM-DD', 없으면 None)
+        (휴장일에서 1 이면 다음 첫 거래일, -1 이면 직전 거래일, 0 은 prev_day)"""
+        day = self.to_day(date)
+        if n >= 0:
+            idx = np.searchsorted(self.days, day, side='right') - 1 + n
+        else:
+            idx = np.searchsorted(self.days, day, side='left') + n
+        return str(self.days[idx]) if 0 <= idx < len(self.days) else None
+
+    def range(self, start_date, end_date):
+        """start_date ~ end_date(포함) 사이의 거래일 datetime64[D] 배열"""
+        lo = np.searchsorted(self.days, self.to_day(start_date), side='left')
+        hi = np.searchsorted(self.days, self.to_day(end_date), side='right')
+        return self.days[lo:hi]
+
+    def report(self):
+        """거래일 수와 기간 출력"""
+        tmnow = datetime.now().strftime('%Y-%m-%d %H:%M')
+        if len(self.days) == 0:
+            print(f"[{tmnow}] Trading calendar ({self.path}) : empty")
+        else:
+            print(f"[{tmnow}] Trading calendar ({self.path}) : "\
+                f"{len(self.days)} days ({self.days[0]} ~ {self.days[-1]})")
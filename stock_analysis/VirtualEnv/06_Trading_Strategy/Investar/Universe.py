@@ -0,0 +1,80 @@
+import numpy as np
+
+class UniverseFilter:
+    def __init__(self, min_value=None, value_days=20, min_price=None,
+            min_listed_days=None, max_missing_days=None):
+        """생성자: 모멘텀 순위를 매기기 전에 거래 가능한 종목만 남기는 조건
+            - min_value        : value_days 동안 평균 거래대금(종가 x 거래량, 원) 하한
+            - value_days       : 거래대금과 누락일을 확인하는 거래일 수
+            - min_price        : 기준일 종가 하한 (동전주 제외)
+            - min_listed_days  : 기준일까지 시세가 있었던 최소 거래일 수 (신규 상장 제외)
+            - max_missing_days : value_days 중 시세가 없는 날의 최대 허용 수
+                                 (거래정지 제외, 0 이면 하루도 빠지면 안 됨)
+            None 인 조건은 적용하지 않는다.
+            예) UniverseFilter(min_value=1e9, min_price=1000,
+                    min_listed_days=250, max_missing_days=0)
+        """
+        self.min_value = min_value
+        self.value_days = value_days
+        self.min_price = min_price
+        self.min_listed_days = min_listed_days
+        self.max_missing_days = max_missing_days
+
+    def __repr__(self):
+        conditions = [f"{key}={value}" for key, value in vars(self).items()
+            if value is not None]
+        return f"UniverseFilter({', '.join(conditions)})"
+
+    def query(self, day, window_start, window_days, listed_day=None):
+        """조건을 daily_price 한 번의 GROUP BY 로 평가하는 쿼리
+            - day          : 기준 거래일 ('2024-04-26')
+            - window_start : day 포함 value_days 거래일의 첫날
+            - window_days  : window_start ~ day 의 거래일 수
+            - listed_day   : min_listed_days 거래일 전 (이날 이전 시세가 있어야 함)
+            (date, code) 인덱스로 기간 행만 훑고, 상장일은 종목별 (code, date)
+            기본키에서 한 행만 확인한다.
+            리턴값: (sql, params)
+        """
+        sql = "SELECT d.code FROM daily_price d "\
+            "WHERE d.date BETWEEN %s AND %s"
+        params = [window_start, day]
+        if self.min_listed_days is not None:
+            sql += " AND EXISTS (SELECT 1 FROM daily_price p "\
+                "WHERE p.code = d.code AND p.date <= %s)"
+            params.append(listed_day)
+        having = []
+        if self.max_missing_days is not None:
+            having.append("COUNT(*) >= %s")
+            params.append(window_days - self.max_missing_days)
+        if self.min_price is not None:
+            having.append("MAX(CASE WHEN d.date = %s THEN d.close END) >= %s")
+            params.extend([day, self.min_price])
+        if self.min_value is not None:
+            having.append("AVG(d.close * d.volume) >= %s")
+            params.append(self.min_value)
+        sql += " GROUP BY d.code"
+        if having:
+            sql += " HAVING " + " AND ".join(having)
+        return sql + " ORDER BY d.code", params
+
+    def mask(self, close, volume, listed=None):
+        """query() 와 같은 조건을 배열에서 평가 (memmap 시세 저장소용)
+            - close, volume : (종목 x window 거래일) 배열, 시세 없는 칸은 NaN
+            - listed        : 종목별로 listed_day 이전 시세가 있으면 True
+            리턴값: 조건을 모두 만족하는 종목의 bool 배열
+        """
+        has_price = ~np.isnan(close)
+        selected = has_price.any(axis=1)
+        if self.min_listed_days is not None:
+            selected &= listed
+        if self.max_missing_days is not None:
+            selected &= has_price.sum(axis=1) >= \
+                close.shape[1] - self.max_missing_days
+        if self.min_price is not None:
+            with np.errstate(invalid='ignore'):
+                selected &= close[:, -1] >= self.min_price
+        if self.min_value is not None:
+            value = np.where(has_price, close * volume, 0.0).sum(axis=1)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                selected &= value / has_price.sum(axis=1) >= self.min_value
+        return selected
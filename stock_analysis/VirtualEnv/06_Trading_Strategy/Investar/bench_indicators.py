@@ -0,0 +1,117 @@
+import time
+import argparse
+import numpy as np
+import pandas as pd
+
+try:
+    from Investar import Indicators
+except ImportError:
+    import Indicators
+
+# Indicators 의 배치 함수와 스트리밍 클래스가 같은 값을 내는지, 그리고 ch06
+# 스크립트들이 쓰던 pandas 계산과 같은지 확인하고 봉 하나당 갱신 시간을 잰다.
+# DB 없이 임의의 OHLCV 로 실행하며, 값이 다르면 AssertionError 를 낸다.
+
+def make_ohlcv(rows, seed=0):
+    """임의의 일봉 데이터프레임 (open, high, low, close, volume)"""
+    rng = np.random.default_rng(seed)
+    close = np.round(50000 * np.cumprod(1 + rng.normal(0, 0.02, rows)))
+    high = close * (1 + rng.uniform(0, 0.03, rows))
+    low = close * (1 - rng.uniform(0, 0.03, rows))
+    high[::50] = low[::50] = close[::50]  # 고가 = 저가 인 날
+    volume = rng.integers(0, 1000000, rows).astype(np.float64)
+    return pd.DataFrame({'open': close, 'high': np.round(high),
+        'low': np.round(low), 'close': close, 'volume': volume})
+
+def pandas_reference(df):
+    """ch06_03 ~ ch06_11 의 원래 pandas 계산"""
+    ref = dict()
+    ref['MA20'] = df.close.rolling(window=20).mean()
+    ref['stddev'] = df.close.rolling(window=20).std()
+    ema60 = df.close.ewm(span=60).mean()
+    ema130 = df.close.ewm(span=130).mean()
+    ref['ema130'] = ema130
+    ref['macd'] = ema60 - ema130
+    ref['signal'] = ref['macd'].ewm(span=45).mean()
+    ndays_high = df.high.rolling(window=14, min_periods=1).max()
+    ndays_low = df.low.rolling(window=14, min_periods=1).min()
+    ref['fast_k'] = (df.close - ndays_low) / (ndays_high - ndays_low) * 100
+    ref['slow_d'] = ref['fast_k'].rolling(window=3).mean()
+    tp = (df.high + df.low + df.close) / 3
+    up = tp > tp.shift(1)
+    pmf = (tp * df.volume).where(up, 0.0)
+    nmf = (tp * df.volume).where(~up & tp.shift(1).notna(), 0.0)
+    ref['MFI10'] = 100 - 100 / (1 + pmf.rolling(window=10).sum() /
+        nmf.rolling(window=10).sum())
+    ii = ((2 * df.close - df.high - df.low) / (df.high - df.low) *
+        df.volume).where(df.high != df.low, 0.0)
+    ref['IIP21'] = ii.rolling(window=21).sum() / \
+        df.volume.rolling(window=21).sum() * 100
+    return ref
+
+def batch(df):
+    """배치 함수로 한 번에 계산"""
+    out = dict()
+    out['MA20'], out['stddev'] = Indicators.rolling_stats(df.close, 20)
+    out['ema130'] = Indicators.ema(df.close, 130)
+    out['macd'], out['signal'], _ = Indicators.macd(df.close, 60, 130, 45)
+    out['fast_k'], out['slow_d'] = Indicators.stochastic(df.high, df.low,
+        df.close, 14, 3)
+    out['MFI10'] = Indicators.mfi(df.high, df.low, df.close, df.volume, 10)
+    out['IIP21'] = Indicators.iip(df.high, df.low, df.close, df.volume, 21)
+    return out
+
+def stream(df):
+    """스트리밍 클래스에 봉을 하나씩 넣어서 계산"""
+    stats = Indicators.RollingStats(20)
+    ema130 = Indicators.EMA(130)
+    macd = Indicators.MACD(60, 130, 45)
+    stoch = Indicators.Stochastic(14, 3)
+    mfi = Indicators.MFI(10)
+    iip = Indicators.IIP(21)
+    rows = []
+    for high, low, close, volume in zip(df.high.values, df.low.values,
+            df.close.values, df.volume.values):
+        mean, std = stats.update(close)
+        line, signal, _ = macd.update(close)
+        fast_k, slow_d = stoch.update(high, low, close)
+        rows.append((mean, std, ema130.update(close), line, signal, fast_k,
+            slow_d, mfi.update(high, low, close, volume),
+            iip.update(high, low, close, volume)))
+    columns = ['MA20', 'stddev', 'ema130', 'macd', 'signal', 'fast_k',
+        'slow_d', 'MFI10', 'IIP21']
+    return dict(zip(columns, np.array(rows).T))
+
+def compare(name, left, right, rtol=1e-8):
+    """두 결과의 최대 상대 오차를 출력하고 rtol 을 넘으면 AssertionError"""
+    for key in left:
+        a = np.asarray(left[key], dtype=np.float64)
+        b = np.asarray(right[key], dtype=np.float64)
+        assert np.array_equal(np.isnan(a), np.isnan(b)), f"{name} {key} NaN"
+        finite = np.isfinite(a)
+        assert np.array_equal(a[~finite & ~np.isnan(a)],
+            b[~finite & ~np.isnan(b)]), f"{name} {key} inf"
+        scale = np.maximum(np.abs(a[finite]), 1.0)
+        error = (np.abs(a[finite] - b[finite]) / scale).max(initial=0.0)
+        print(f"{name:18s} {key:8s}: max relative error {error:.2e}")
+        assert error <= rtol, f"{name} {key} differs ({error:.2e})"
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=5000,
+        help='일봉 수 (20년 = 약 5,000)')
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.rows)
+    t0 = time.perf_counter()
+    batch_out = batch(df)
+    t1 = time.perf_counter()
+    stream_out = stream(df)
+    t2 = time.perf_counter()
+    compare('batch vs stream', batch_out, stream_out)
+    # pandas 의 rolling std 는 전 구간을 이어서 갱신하므로 가격대가 크게
+    # 바뀐 뒤에는 구간마다 다시 계산하는 배치 함수보다 오차가 크다
+    compare('batch vs pandas', batch_out, pandas_reference(df), 1e-5)
+    print(f"\nbatch  : {args.rows} rows in {(t1 - t0) * 1000:.1f} ms")
+    print(f"stream : {(t2 - t1) / args.rows * 1e6:.1f} us per bar "\
+        f"(all indicators)")
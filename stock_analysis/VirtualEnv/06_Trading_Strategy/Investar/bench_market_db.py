@@ -0,0 +1,51 @@
+import time
+import argparse
+import pandas as pd
+from datetime import datetime, timedelta
+
+try:
+    from Investar import DBPool, FastQuery
+except ImportError:
+    import DBPool, FastQuery
+
+# MarketDB 의 이전 조회 경로(pd.read_sql + df.index = df['date'])와 FastQuery
+# 경로(커서에서 int64 배열에 바로 채움)의 초당 처리 행 수 비교. 로컬 MariaDB 의
+# daily_price 에서 company_info 앞쪽 --codes 개 종목을 1년, 20년 기간으로 읽는다.
+
+def old_path(codes, start_date, end_date):
+    """이전 read_daily_price() 의 read_sql 경로"""
+    sql = "SELECT * FROM daily_price WHERE code IN %(codes)s"\
+        " and date >= %(start)s and date <= %(end)s"
+    df = pd.read_sql(sql, DBPool.get_engine(), params={'codes': tuple(codes),
+        'start': start_date, 'end': end_date})
+    df.index = df['date']
+    return df
+
+def new_path(codes, start_date, end_date):
+    """FastQuery 경로"""
+    with DBPool.connection() as conn:
+        df = FastQuery.read_prices(conn, codes, start_date, end_date)
+    df.index = pd.DatetimeIndex(df['date'], name='date')
+    return df
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--codes', type=int, default=100,
+        help='읽을 종목 수 (1 이면 종목 하나)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    codes = list(pd.read_sql(f"SELECT code FROM company_info ORDER BY code "\
+        f"LIMIT {args.codes}", DBPool.get_engine())['code'])
+    end_date = datetime.today().strftime('%Y-%m-%d')
+    for years in (1, 20):
+        start_date = (datetime.today() - timedelta(days=365 * years)).strftime(
+            '%Y-%m-%d')
+        for name, func in [('pd.read_sql', old_path), ('FastQuery', new_path)]:
+            func(codes, start_date, end_date)  # 연결과 버퍼 풀 예열
+            t0 = time.perf_counter()
+            for _ in range(args.repeat):
+                df = func(codes, start_date, end_date)
+            elapsed = (time.perf_counter() - t0) / args.repeat
+            print(f"{years:2d} year(s) {name:12s}: {len(df):,} rows in "\
+                f"{elapsed:.3f} sec ({len(df) / elapsed:,.0f} rows/sec)")
@@ -0,0 +1,85 @@
+import sys
+import time
+import pandas as pd
+from io import StringIO
+from datetime import date, timedelta
+
+try:
+    from Investar import NaverParser
+except ImportError:
+    import NaverParser
+
+# read_naver() 의 이전 파싱 경로(pd.read_html + 문자열 정리)와 NaverParser 의
+# lxml 직접 파싱 경로의 초당 페이지 처리 수 비교. 인자로 저장해 둔 네이버
+# sise_day HTML 파일을 주면 그 파일을, 없으면 같은 구조의 가짜 페이지를 사용한다.
+
+ROW = """
+<tr onmouseover="mouseOver(this)" onmouseout="mouseOut(this)">
+<td align="center"><span class="tah p10 gray03">{date}</span></td>
+<td class="num"><span class="tah p11">{close:,}</span></td>
+<td class="num">
+    <em class="bu_p {mark}"><span class="blind">{text}</span></em>
+    <span class="tah p11 {color}">{diff:,}</span>
+</td>
+<td class="num"><span class="tah p11">{open:,}</span></td>
+<td class="num"><span class="tah p11">{high:,}</span></td>
+<td class="num"><span class="tah p11">{low:,}</span></td>
+<td class="num"><span class="tah p11">{volume:,}</span></td>
+</tr>
+"""
+
+def make_page(rows=10):
+    """네이버 sise_day 페이지와 같은 구조의 가짜 HTML 생성"""
+    body = []
+    day = date(2024, 1, 31)
+    for i in range(rows):
+        up = i % 2 == 0
+        body.append(ROW.format(date=day.strftime('%Y.%m.%d'),
+            close=70000 + i * 100, diff=100 * (i + 1),
+            mark='bu_pup' if up else 'bu_pdn', text='상승' if up else '하락',
+            color='red02' if up else 'nv01', open=69000 + i * 100,
+            high=71000 + i * 100, low=68000 + i * 100, volume=1234567 + i))
+        day -= timedelta(days=1)
+        if i == 4:
+            body.append('<tr><td colspan="7" height="8"></td></tr>')
+    return """<html><body>
+<table cellspacing="0" class="type2">
+<tr><th>날짜</th><th>종가</th><th>전일비</th><th>시가</th><th>고가</th>
+<th>저가</th><th>거래량</th></tr>
+<tr><td colspan="7" height="8"></td></tr>
+""" + ''.join(body) + """</table>
+<table class="Nnavi"><tr><td class="pgRR">
+<a href="/item/sise_day.naver?code=005930&amp;page=123">맨뒤</a></td></tr></table>
+</body></html>"""
+
+def old_parse(page_html):
+    """이전 read_naver() 의 파싱 경로"""
+    df = pd.read_html(StringIO(page_html), header=0)[0]
+    df = df.dropna()
+    df = df.rename(columns={'날짜':'date','종가':'close','전일비':'diff'
+        ,'시가':'open','고가':'high','저가':'low','거래량':'volume'})
+    df['date'] = df['date'].replace('.', '-')
+    for col in ['close', 'diff', 'open', 'high', 'low', 'volume']:
+        df[col] = df[col].astype(str).str.replace(r'[^0-9]', '', regex=True).astype(int)
+    return df[['date', 'open', 'high', 'low', 'close', 'diff', 'volume']]
+
+def new_parse(page_html):
+    """NaverParser 경로"""
+    return NaverParser.to_frame(NaverParser.parse_page(page_html))
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], encoding='utf-8') as in_file:
+            page_html = in_file.read()
+    else:
+        page_html = make_page()
+    iterations = 500
+
+    for name, func in [('pd.read_html', old_parse), ('NaverParser', new_parse)]:
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            df = func(page_html)
+        elapsed = time.perf_counter() - t0
+        print(f"{name:15s}: {iterations / elapsed:,.0f} pages/sec "\
+            f"({len(df)} rows/page)")
+    print(new_parse(page_html))
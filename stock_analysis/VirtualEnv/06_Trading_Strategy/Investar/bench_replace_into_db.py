@@ -0,0 +1,132 @@
+import time
+import sqlite3
+import argparse
+import pymysql
+from datetime import date, timedelta
+
+# DBUpdater.replace_into_db 의 이전 경로(행마다 execute)와 새 경로(executemany
+# 일괄 처리)의 초당 처리 행 수 비교. 실제 차이는 서버 왕복 횟수에서 나오므로
+# --mysql 옵션으로 로컬 MariaDB 의 daily_price_bench 테이블을 써서 재는 것이
+# 기본 사용법이다.
+#   python bench_replace_into_db.py --mysql
+# MariaDB 가 없으면 SQLite 메모리 DB 를 쓰는데, 같은 프로세스 안이라 왕복이
+# 없으므로 execute/executemany/commit 호출마다 --latency 밀리초를 기다려서
+# 서버 왕복을 흉내 낸다 (pymysql 은 REPLACE ... VALUES 의 executemany 를
+# 여러 행 문장 하나로 보내므로 호출 한 번이 왕복 한 번). --latency 0 이면
+# 왕복 없는 SQLite 자체 속도만 재므로 두 경로의 차이를 제대로 보여 주지 못한다.
+
+SQL = "REPLACE INTO daily_price_bench VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+
+def make_rows(count):
+    """가짜 일별 시세 행 count 개 생성"""
+    rows = []
+    start = date(2000, 1, 1)
+    for i in range(count):
+        code = f"{i % 500:06d}"
+        day = (start + timedelta(days=i // 500)).strftime('%Y-%m-%d')
+        rows.append((code, day, 1000 + i, 1100 + i, 900 + i, 1050 + i, 50,
+            100000 + i))
+    return rows
+
+class LatencyCursor:
+    def __init__(self, curs, latency):
+        """생성자: SQLite 커서의 execute/executemany 호출마다 latency 초를 기다림"""
+        self.curs = curs
+        self.latency = latency
+
+    def execute(self, sql, args=()):
+        time.sleep(self.latency)
+        return self.curs.execute(sql, args)
+
+    def executemany(self, sql, args):
+        time.sleep(self.latency)
+        return self.curs.executemany(sql, args)
+
+    def close(self):
+        self.curs.close()
+
+class LatencyConnection:
+    def __init__(self, conn, latency):
+        """생성자: SQLite 연결의 cursor 와 commit 에 서버 왕복 지연을 더함"""
+        self.conn = conn
+        self.latency = latency
+
+    def cursor(self):
+        return LatencyCursor(self.conn.cursor(), self.latency)
+
+    def commit(self):
+        time.sleep(self.latency)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+def connect(use_mysql, latency=0.0):
+    """벤치마크용 연결과 placeholder 를 맞춘 SQL 문 반환
+        - latency : SQLite 일 때 호출마다 더할 왕복 지연(초)
+    """
+    if use_mysql:
+        conn = pymysql.connect(host='localhost', user='root',
+            password='doolman', db='INVESTAR', charset='utf8')
+        sql = SQL
+    else:
+        conn = LatencyConnection(sqlite3.connect(':memory:'), latency)
+        sql = SQL.replace('%s', '?')
+    curs = conn.cursor()
+    curs.execute("DROP TABLE IF EXISTS daily_price_bench")
+    curs.execute("""
+        CREATE TABLE daily_price_bench (
+            code VARCHAR(20),
+            date DATE,
+            open BIGINT(20),
+            high BIGINT(20),
+            low BIGINT(20),
+            close BIGINT(20),
+            diff BIGINT(20),
+            volume BIGINT(20),
+            PRIMARY KEY (code, date))
+    """)
+    curs.close()
+    conn.commit()
+    return conn, sql
+
+def old_path(conn, sql, rows):
+    """행마다 execute 한 번, 마지막에 commit 한 번"""
+    curs = conn.cursor()
+    for r in rows:
+        curs.execute(sql, r)
+    conn.commit()
+    curs.close()
+
+def new_path(conn, sql, rows, batch_size):
+    """batch_size 행씩 executemany, 배치마다 commit"""
+    curs = conn.cursor()
+    for start in range(0, len(rows), batch_size):
+        curs.executemany(sql, rows[start:start + batch_size])
+        conn.commit()
+    curs.close()
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--mysql', action='store_true',
+        help='로컬 MariaDB 에서 측정 (권장)')
+    parser.add_argument('--latency', type=float, default=0.2,
+        help='SQLite 일 때 흉내 낼 서버 왕복 지연(밀리초)')
+    args = parser.parse_args()
+    if not args.mysql:
+        print(f"SQLite in-memory with {args.latency} ms simulated round trip "\
+            f"(use --mysql for a real measurement)")
+
+    rows = make_rows(args.rows)
+    for name, func in [('row-by-row', lambda c, s: old_path(c, s, rows)),
+            (f'executemany({args.batch_size})',
+            lambda c, s: new_path(c, s, rows, args.batch_size))]:
+        conn, sql = connect(args.mysql, args.latency / 1000)
+        t0 = time.perf_counter()
+        func(conn, sql)
+        elapsed = time.perf_counter() - t0
+        conn.close()
+        print(f"{name:20s}: {len(rows):,} rows in {elapsed:.2f} sec "\
+            f"({len(rows) / elapsed:,.0f} rows/sec)")
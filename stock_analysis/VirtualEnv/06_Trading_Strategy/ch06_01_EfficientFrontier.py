@@ -6,13 +6,11 @@ from Investar import Analyzer
 
 mk = Analyzer.MarketDB()
 stocks = ['삼성전자', 'SK하이닉스', '현대자동차', 'NAVER']
-df = pd.DataFrame()
-for s in stocks:
-    df[s] = mk.get_daily_price(s, '2024-01-04', '2024-04-27')['close']
+# DBUpdater 가 미리 계산한 일간 수익률 (분할 등 기준가 조정 반영)
+daily_ret = mk.get_daily_returns(stocks, '2024-01-04', '2024-04-27')
 
 # print(df)
 
-daily_ret = df.pct_change() 
 annual_ret = daily_ret.mean() * 252
 daily_cov = daily_ret.cov() 
 annual_cov = daily_cov * 252
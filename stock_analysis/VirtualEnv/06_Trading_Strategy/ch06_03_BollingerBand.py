@@ -1,11 +1,10 @@
 import matplotlib.pyplot as plt
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('NAVER', '2024-01-02')
   
-df['MA20'] = df['close'].rolling(window=20).mean()  # ①
-df['stddev'] = df['close'].rolling(window=20).std() # ②
+df['MA20'], df['stddev'] = Indicators.rolling_stats(df['close'], 20)  # ① ②
 df['upper'] = df['MA20'] + (df['stddev'] * 2)   # ③
 df['lower'] = df['MA20'] - (df['stddev'] * 2)   # ④
 df = df[19:]  # ⑤
@@ -1,12 +1,11 @@
 
 import matplotlib.pyplot as plt
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('NAVER', '2024-01-02')
   
-df['MA20'] = df['close'].rolling(window=20).mean() 
-df['stddev'] = df['close'].rolling(window=20).std() 
+df['MA20'], df['stddev'] = Indicators.rolling_stats(df['close'], 20)
 df['upper'] = df['MA20'] + (df['stddev'] * 2)
 df['lower'] = df['MA20'] - (df['stddev'] * 2)
 df['PB'] = (df['close'] - df['lower']) / (df['upper'] - df['lower'])  # ①
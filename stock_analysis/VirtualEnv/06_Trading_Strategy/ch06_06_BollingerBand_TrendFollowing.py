@@ -1,27 +1,15 @@
 import matplotlib.pyplot as plt
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('NAVER', '2024-01-02')
   
-df['MA20'] = df['close'].rolling(window=20).mean() 
-df['stddev'] = df['close'].rolling(window=20).std() 
+df['MA20'], df['stddev'] = Indicators.rolling_stats(df['close'], 20)
 df['upper'] = df['MA20'] + (df['stddev'] * 2)
 df['lower'] = df['MA20'] - (df['stddev'] * 2)
 df['PB'] = (df['close'] - df['lower']) / (df['upper'] - df['lower'])
-df['TP'] = (df['high'] + df['low'] + df['close']) / 3
-df['PMF'] = 0
-df['NMF'] = 0
-for i in range(len(df.close)-1):
-    if df.TP.values[i] < df.TP.values[i+1]:
-        df.PMF.values[i+1] = df.TP.values[i+1] * df.volume.values[i+1]
-        df.NMF.values[i+1] = 0
-    else:
-        df.NMF.values[i+1] = df.TP.values[i+1] * df.volume.values[i+1]
-        df.PMF.values[i+1] = 0
-df['MFR'] = (df.PMF.rolling(window=10).sum() /
-    df.NMF.rolling(window=10).sum())
-df['MFI10'] = 100 - 100 / (1 + df['MFR'])
+df['MFI10'] = Indicators.mfi(df['high'], df['low'], df['close'],
+    df['volume'], 10)
 df = df[19:]
 
 plt.figure(figsize=(9, 8))
@@ -1,17 +1,16 @@
 import matplotlib.pyplot as plt
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('SK하이닉스', '2024-01-02')
   
-df['MA20'] = df['close'].rolling(window=20).mean() 
-df['stddev'] = df['close'].rolling(window=20).std() 
+df['MA20'], df['stddev'] = Indicators.rolling_stats(df['close'], 20)
 df['upper'] = df['MA20'] + (df['stddev'] * 2)
 df['lower'] = df['MA20'] - (df['stddev'] * 2)
 df['PB'] = (df['close'] - df['lower']) / (df['upper'] - df['lower'])
 
-df['II'] = (2*df['close']-df['high']-df['low'])/(df['high']-df['low'])*df['volume']
-df['IIP21'] = df['II'].rolling(window=21).sum()/df['volume'].rolling(window=21).sum()*100
+df['IIP21'] = Indicators.iip(df['high'], df['low'], df['close'],
+    df['volume'], 21)
 df = df.dropna()
 
 plt.figure(figsize=(9, 9))
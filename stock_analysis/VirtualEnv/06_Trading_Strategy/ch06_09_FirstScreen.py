@@ -6,17 +6,16 @@ import datetime
 # https://wikidocs.net/229246
 from mplfinance.original_flavor import candlestick_ohlc
 import matplotlib.dates as mdates
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('엔씨소프트', '2024-01-02')
 
 
-ema60 = df.close.ewm(span=60).mean()   # ① 종가의 12주 지수 이동평균
-ema130 = df.close.ewm(span=130).mean() # ② 종가의 12주 지수 이동평균
-macd = ema60 - ema130                  # ③ MACD선
-signal = macd.ewm(span=45).mean()      # ④ 신호선(MACD의 9주 지수 이동평균)
-macdhist = macd - signal               # ⑤ MACD 히스토그램
+ema60 = Indicators.ema(df.close, 60)    # ① 종가의 12주 지수 이동평균
+ema130 = Indicators.ema(df.close, 130)  # ② 종가의 26주 지수 이동평균
+# ③ MACD선, ④ 신호선(MACD의 9주 지수 이동평균), ⑤ MACD 히스토그램
+macd, signal, macdhist = Indicators.macd(df.close, 60, 130, 45)
 
 df = df.assign(ema130=ema130, ema60=ema60, macd=macd, signal=signal, macdhist=macdhist).dropna() 
 df['number'] = df.index.map(mdates.date2num)  # ⑥
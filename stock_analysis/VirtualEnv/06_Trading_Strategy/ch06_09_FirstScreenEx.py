@@ -1,17 +1,16 @@
 import pandas as pd
 import mplfinance as mpf
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('엔씨소프트', '2024-01-01', '2024-12-31')
 df.index = pd.to_datetime(df.date)
 df = df[['open', 'high', 'low', 'close', 'volume']] 
 
-ema60 = df.close.ewm(span=60).mean()   # ① 종가의 12주 지수 이동평균
-ema130 = df.close.ewm(span=130).mean() # ② 종가의 26주 지수 이동평균
-macd = ema60 - ema130                  # ③ MACD선
-signal = macd.ewm(span=45).mean()      # ④ 신호선(MACD의 9주 지수 이동평균)
-macdhist = macd - signal               # ⑤ MACD 히스토그램
+ema60 = Indicators.ema(df.close, 60)    # ① 종가의 12주 지수 이동평균
+ema130 = Indicators.ema(df.close, 130)  # ② 종가의 26주 지수 이동평균
+# ③ MACD선, ④ 신호선(MACD의 9주 지수 이동평균), ⑤ MACD 히스토그램
+macd, signal, macdhist = Indicators.macd(df.close, 60, 130, 45)
 
 apds = [mpf.make_addplot(ema130, color='c'),
     mpf.make_addplot(macdhist, type='bar', panel=1, color='m'),
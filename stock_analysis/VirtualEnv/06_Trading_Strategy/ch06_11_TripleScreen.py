@@ -4,26 +4,20 @@ import datetime
 # from mpl_finance import candlestick_ohlc
 from mplfinance.original_flavor import candlestick_ohlc
 import matplotlib.dates as mdates
-from Investar import Analyzer
+from Investar import Analyzer, Indicators
 
 mk = Analyzer.MarketDB()
 df = mk.get_daily_price('엔씨소프트', '2024-01-01')
 
-ema60 = df.close.ewm(span=60).mean()
-ema130 = df.close.ewm(span=130).mean()
-macd = ema60 - ema130
-signal = macd.ewm(span=45).mean()
-macdhist = macd - signal
+ema60 = Indicators.ema(df.close, 60)
+ema130 = Indicators.ema(df.close, 130)
+macd, signal, macdhist = Indicators.macd(df.close, 60, 130, 45)
 df = df.assign(ema130=ema130, ema60=ema60, macd=macd, signal=signal, macdhist=macdhist).dropna()
 
 df['number'] = df.index.map(mdates.date2num)
 ohlc = df[['number','open','high','low','close']]
 
-ndays_high = df.high.rolling(window=14, min_periods=1).max()
-ndays_low = df.low.rolling(window=14, min_periods=1).min()
-
-fast_k = (df.close - ndays_low) / (ndays_high - ndays_low) * 100
-slow_d = fast_k.rolling(window=3).mean()
+fast_k, slow_d = Indicators.stochastic(df.high, df.low, df.close, 14, 3)
 df = df.assign(fast_k=fast_k, slow_d=slow_d).dropna()
 
 plt.figure(figsize=(9, 9))
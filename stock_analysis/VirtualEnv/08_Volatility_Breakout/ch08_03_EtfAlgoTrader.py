@@ -8,6 +8,7 @@ from bs4 import BeautifulSoup
 from urllib.request import urlopen
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options 
+from Investar import Indicators
 
 slack = Slacker('')
 def dbgout(message):
@@ -141,18 +142,25 @@ def get_target_price(code):
         dbgout("`get_target_price() -> exception! " + str(ex) + "`")
         return None
     
+ma_cache = {}  # (종목코드, window) -> (조회일, 전일 기준 이동평균가격)
+
 def get_movingaverage(code, window):
-    """인자로 받은 종목에 대한 이동평균가격을 반환한다."""
+    """인자로 받은 종목에 대한 이동평균가격을 반환한다.
+    (전일까지의 이동평균은 장중에 바뀌지 않으므로 하루에 한 번만 계산한다)"""
     try:
         time_now = datetime.now()
         str_today = time_now.strftime('%Y%m%d')
+        cached = ma_cache.get((code, window))
+        if cached is not None and cached[0] == str_today:
+            return cached[1]
         ohlc = get_ohlc(code, 20)
         if str_today == str(ohlc.iloc[0].name):
             lastday = ohlc.iloc[1].name
         else:
             lastday = ohlc.iloc[0].name
         closes = ohlc['close'].sort_index()         
-        ma = closes.rolling(window=window).mean()
+        ma, _ = Indicators.rolling_stats(closes, window)
+        ma_cache[(code, window)] = (str_today, ma.loc[lastday])
         return ma.loc[lastday]
     except Exception as ex:
         dbgout('get_movingavrg(' + str(window) + ') -> exception! ' + str(ex))